@@ -0,0 +1,137 @@
+"""Persistent on-disk cache for API responses."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+
+def default_cache_dir() -> Path:
+    """Return the per-user cache directory (honours XDG_CACHE_HOME)."""
+    base = os.environ.get("XDG_CACHE_HOME")
+    return (Path(base) if base else Path.home() / ".cache") / "pkgrisk"
+
+
+@dataclass
+class CachedResponse:
+    """A stored response body with its validator."""
+
+    body: bytes
+    etag: str | None
+    stored_at: float
+
+    def age(self) -> float:
+        """Seconds since the entry was stored or last revalidated."""
+        return time.time() - self.stored_at
+
+
+class ResponseCache:
+    """SQLite-backed cache of raw response bodies keyed by request.
+
+    Bodies are stored zlib-compressed alongside their ETag so callers can
+    revalidate with If-None-Match. Once the cache holds more than
+    ``max_entries`` rows, the least recently stored ones are evicted.
+
+    The database is opened lazily on first use.
+    """
+
+    # Check the entry count every this many writes
+    EVICT_EVERY = 200
+
+    def __init__(self, path: Path, max_entries: int = 50_000) -> None:
+        """Initialize the cache.
+
+        Args:
+            path: SQLite database file. Parent directories are created on first use.
+            max_entries: Maximum number of responses kept.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self._db: sqlite3.Connection | None = None
+        self._writes = 0
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Build a cache key from request parts (method, URL, params, body...)."""
+        raw = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.path)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " etag TEXT,"
+                " body BLOB NOT NULL,"
+                " stored_at REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS responses_stored_at ON responses (stored_at)"
+            )
+        return self._db
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Look up a cached response."""
+        row = self._connect().execute(
+            "SELECT body, etag, stored_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        try:
+            body = zlib.decompress(row[0])
+        except zlib.error:
+            return None
+        return CachedResponse(body=body, etag=row[1], stored_at=row[2])
+
+    def set(self, key: str, body: bytes, etag: str | None = None) -> None:
+        """Store a response body."""
+        db = self._connect()
+        with db:
+            db.execute(
+                "INSERT OR REPLACE INTO responses (key, etag, body, stored_at)"
+                " VALUES (?, ?, ?, ?)",
+                (key, etag, zlib.compress(body), time.time()),
+            )
+        self._writes += 1
+        if self._writes % self.EVICT_EVERY == 0:
+            self._evict()
+
+    def touch(self, key: str) -> None:
+        """Mark an entry as freshly revalidated."""
+        db = self._connect()
+        with db:
+            db.execute(
+                "UPDATE responses SET stored_at = ? WHERE key = ?", (time.time(), key)
+            )
+
+    def _evict(self) -> None:
+        """Drop the oldest entries beyond max_entries."""
+        db = self._connect()
+        with db:
+            db.execute(
+                "DELETE FROM responses WHERE key IN ("
+                " SELECT key FROM responses ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        db = self._connect()
+        with db:
+            db.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
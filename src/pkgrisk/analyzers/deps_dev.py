@@ -22,7 +22,7 @@ from typing import TYPE_CHECKING
 import httpx
 
 if TYPE_CHECKING:
-    from pkgrisk.models.schemas import Platform, RepoRef
+    from pkgrisk.models.schemas import AggregatorData, Platform, RepoRef
 
 logger = logging.getLogger(__name__)
 
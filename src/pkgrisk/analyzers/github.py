@@ -1,10 +1,24 @@
 """GitHub data fetcher for repository analysis."""
 
+import asyncio
+import base64
+import hashlib
+import heapq
+import importlib.util
+import json
+import logging
+import math
 import os
+import re
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
+from typing import Any
 
 import httpx
 
+from pkgrisk.analyzers.cache import ResponseCache
 from pkgrisk.models.schemas import (
     CIStatus,
     CommitActivity,
@@ -19,6 +33,243 @@ from pkgrisk.models.schemas import (
     SecurityData,
 )
 
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None  # type: ignore[assignment]
+
+_b64decode = base64.b64decode
+
+# GitHub timestamps end in "Z", which fromisoformat accepts natively on 3.11+
+_parse_datetime = datetime.fromisoformat
+
+# Decode JSON bodies with orjson when it's installed
+_loads = orjson.loads if orjson is not None else json.loads
+
+_GOOD_FIRST_LABELS = frozenset(
+    {"good first issue", "good-first-issue", "good first contribution"}
+)
+
+# Release asset name fragments that indicate a signature
+_SIGNATURE_RE = re.compile(r"\.(?:sig|asc|sign)", re.IGNORECASE)
+
+# Workflow categories, matched against workflow names and file contents
+_TEST_WORKFLOW_RE = re.compile(r"test|ci|build|check", re.IGNORECASE)
+_LINT_WORKFLOW_RE = re.compile(
+    r"lint|format|style|eslint|prettier|ruff|black", re.IGNORECASE
+)
+_SECURITY_WORKFLOW_RE = re.compile(r"security|codeql|snyk|trivy|scan", re.IGNORECASE)
+_RELEASE_WORKFLOW_RE = re.compile(r"release|publish|deploy", re.IGNORECASE)
+_TEST_TOOLS_RE = re.compile(
+    r"pytest|jest|npm test|go test|cargo test|unittest", re.IGNORECASE
+)
+_LINT_TOOLS_RE = re.compile(
+    r"eslint|prettier|ruff|black|flake8|mypy|clippy", re.IGNORECASE
+)
+_SECURITY_TOOLS_RE = re.compile(r"codeql|snyk|trivy|semgrep|dependabot", re.IGNORECASE)
+_RELEASE_TOOLS_RE = re.compile(
+    r"npm publish|twine upload|cargo publish|goreleaser", re.IGNORECASE
+)
+
+# Paths left out of the security code sample (tests, vendored and built code, docs)
+_SKIP_SOURCE_PATH_RE = re.compile(
+    r"test|spec|mock|fixture|vendor|node_modules|dist|build|__pycache__|\.min\."
+    r"|example|sample|benchmark|doc/|docs/"
+)
+
+# Security and supply-chain tooling referenced in workflow files; the name of
+# the group that matched identifies the signal
+_WORKFLOW_SIGNALS_RE = re.compile(
+    r"(?P<codeql>github/codeql-action)"
+    r"|(?P<snyk>snyk/actions|snyk-)"
+    r"|(?P<trivy>aquasecurity/trivy|trivy-action)"
+    r"|(?P<semgrep>semgrep)"
+    r"|(?P<sigstore>sigstore/cosign|cosign-installer)"
+    r"|(?P<sbom>anchore/sbom-action|cyclonedx|spdx)"
+    r"|(?P<slsa>slsa-framework|slsa-github-generator)"
+    r"|(?P<slsa3>slsa-builder-go|slsa-verifier)"
+    r"|(?P<provenance>provenance)",
+    re.IGNORECASE,
+)
+
+# Repository metadata plus the most recent releases in a single GraphQL request
+_REPO_OVERVIEW_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    description
+    stargazerCount
+    forkCount
+    createdAt
+    updatedAt
+    pushedAt
+    isArchived
+    isFork
+    hasDiscussionsEnabled
+    defaultBranchRef { name }
+    licenseInfo { spdxId }
+    primaryLanguage { name }
+    repositoryTopics(first: 20) { nodes { topic { name } } }
+    issues(states: OPEN) { totalCount }
+    pullRequests(states: OPEN) { totalCount }
+    releases(first: 100, orderBy: {field: CREATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage }
+      nodes {
+        tagName
+        publishedAt
+        isPrerelease
+        releaseAssets(first: 100) {
+          pageInfo { hasNextPage }
+          nodes { name }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def _b64_text(blob: dict | None) -> str | None:
+    """Decode the base64 content of a blob or contents API item as UTF-8 text.
+
+    Returns None when there is no content or it isn't valid UTF-8.
+    """
+    content = (blob or {}).get("content")
+    if not content:
+        return None
+    try:
+        # binascii.Error and UnicodeDecodeError are both ValueErrors
+        return _b64decode(content).decode("utf-8")
+    except ValueError:
+        return None
+
+
+def _keep_fields(*fields: str) -> Callable[[dict], dict]:
+    """Build a projection that keeps only the given keys of a list item."""
+
+    def project(item: dict) -> dict:
+        return {key: item[key] for key in fields if key in item}
+
+    return project
+
+
+# Fields read by the issue and pull request stats
+_issue_fields = _keep_fields("number", "created_at", "closed_at", "labels", "pull_request")
+_pr_fields = _keep_fields("created_at", "closed_at", "merged_at")
+
+
+def _commit_summary(commit: dict) -> tuple[str | None, str | None, bool]:
+    """Reduce a commit list item to (author login, authored date, signature verified)."""
+    author = commit.get("author") or {}
+    details = commit.get("commit", {})
+    return (
+        author.get("login"),
+        details.get("author", {}).get("date"),
+        details.get("verification", {}).get("verified", False),
+    )
+
+
+async def _value(value: Any) -> Any:
+    """Wrap an already-known value as an awaitable, for use alongside fetches."""
+    return value
+
+
+async def _gather(*aws: Awaitable[Any]) -> list[Any]:
+    """Await independent fetches concurrently.
+
+    Every fetch runs to completion, then the first failure is re-raised, so
+    errors (rate limits, 5xx) still fail the analysis as they did when the
+    fetches ran one after another.
+    """
+    results = await asyncio.gather(*aws, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
+
+@dataclass
+class RepoTree:
+    """Flattened recursive git tree of a repository."""
+
+    entries: dict[str, dict]  # path -> tree entry (type, sha, size, ...)
+    truncated: bool = False
+    # Directory path -> (name, entry) of its direct children; built on first use
+    _children: dict[str, list[tuple[str, dict]]] | None = field(default=None, repr=False)
+
+    def children(self, path: str) -> list[tuple[str, dict]]:
+        """Direct children of a directory ("" for the root) as (name, entry) pairs."""
+        if self._children is None:
+            index: dict[str, list[tuple[str, dict]]] = {}
+            for entry_path, entry in self.entries.items():
+                parent, _, name = entry_path.rpartition("/")
+                index.setdefault(parent, []).append((name, entry))
+            self._children = index
+        return self._children.get(path, [])
+
+
+@dataclass(slots=True, frozen=True)
+class _TimeCutoffs:
+    """Reference times shared by all stats of one repository analysis."""
+
+    now: datetime
+    ninety_days_ago: datetime
+    six_months_ago: datetime
+    one_year_ago: datetime
+    # "since" query values, floored to the hour so repeated runs reuse cached responses
+    since_6mo: str
+    since_1y: str
+
+    @classmethod
+    def current(cls) -> "_TimeCutoffs":
+        now = datetime.now(timezone.utc)
+        six_months_ago = now - timedelta(days=180)
+        one_year_ago = now - timedelta(days=365)
+        return cls(
+            now=now,
+            ninety_days_ago=now - timedelta(days=90),
+            six_months_ago=six_months_ago,
+            one_year_ago=one_year_ago,
+            since_6mo=six_months_ago.replace(minute=0, second=0, microsecond=0).isoformat(),
+            since_1y=one_year_ago.replace(minute=0, second=0, microsecond=0).isoformat(),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class _OpenCounts:
+    """Numbers of open issues and open pull requests in a repository."""
+
+    issues: int
+    pull_requests: int
+
+
+@dataclass(slots=True)
+class IssueRecord:
+    """Recent issue, trimmed down for LLM consumption."""
+
+    title: str | None
+    state: str | None
+    created_at: str | None
+    comments: int
+    labels: tuple[str, ...]
+    body: str
+
+
+@dataclass(slots=True)
+class RepoContent:
+    """Repository documents and discussion used by the LLM assessments.
+
+    A field is left empty when the document doesn't exist or couldn't be fetched.
+    """
+
+    readme: str | None = None
+    issues: list[IssueRecord] = field(default_factory=list)
+    maintainer_comments: list[str] = field(default_factory=list)
+    changelog: str | None = None
+    governance: str | None = None
+    code_samples: str | None = None
+
 
 class GitHubFetcher:
     """Fetches repository data from GitHub API.
@@ -29,25 +280,105 @@ class GitHubFetcher:
 
     BASE_URL = "https://api.github.com"
 
+    # Number of recursive trees kept in memory; trees of large repos are big
+    TREE_CACHE_SIZE = 8
+
+    # Number of decoded file contents kept in memory
+    CONTENT_CACHE_SIZE = 64
+
+    # Number of repositories whose contributor and commit lists are kept in memory
+    REPO_LIST_CACHE_SIZE = 8
+
+    # Concurrent page requests per paginated fetch (GitHub secondary rate limits)
+    PAGE_CONCURRENCY = 8
+
+    # Seconds a cached response without an ETag is reused without asking GitHub
+    CACHE_TTL = 15 * 60
+
+    # Seconds a cached response with an ETag is reused before it is revalidated
+    REVALIDATE_AFTER = 60
+
+    # Media type that makes the contents API return file bodies as-is
+    RAW_MEDIA_TYPE = "application/vnd.github.raw"
+
+    # Requests in flight at once across all fetches of this fetcher
+    MAX_CONCURRENT_REQUESTS = 16
+
+    # Retries for transient errors and secondary rate limits, with exponential
+    # backoff starting at RETRY_BASE_DELAY seconds; waits are capped at
+    # MAX_RETRY_DELAY even if GitHub asks for longer
+    MAX_RETRIES = 4
+    RETRY_BASE_DELAY = 1.0
+    MAX_RETRY_DELAY = 60.0
+    RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+    # Changelog filenames to look for, in priority order
+    CHANGELOG_NAMES: list[str] = [
+        "CHANGELOG.md",
+        "CHANGELOG",
+        "CHANGELOG.txt",
+        "CHANGES.md",
+        "CHANGES",
+        "HISTORY.md",
+        "HISTORY",
+        "NEWS.md",
+        "NEWS",
+    ]
+
+    # Governance-related files combined for LLM analysis
+    GOVERNANCE_FILES: list[str] = [
+        "GOVERNANCE.md",
+        "CONTRIBUTING.md",
+        "MAINTAINERS.md",
+        "MAINTAINERS",
+        ".github/CONTRIBUTING.md",
+    ]
+
     def __init__(
         self,
         token: str | None = None,
         client: httpx.AsyncClient | None = None,
+        cache: ResponseCache | None = None,
     ) -> None:
         """Initialize the fetcher.
 
         Args:
             token: GitHub personal access token. If not provided, uses GITHUB_TOKEN env var.
-            client: Optional httpx client. If not provided, a new client is created.
+            client: Optional httpx client. If not provided, a pooled client is created
+                on first use and reused until aclose().
+            cache: Optional on-disk response cache. Cached responses are revalidated
+                with If-None-Match; a 304 doesn't count against the rate limit.
         """
         self._token = token or os.environ.get("GITHUB_TOKEN")
         self._client = client
+        self._owned_client: httpx.AsyncClient | None = None
+        self._cache = cache
+        # Cached bodies depend on who asked (private repos, permissions), so
+        # entries are keyed by a fingerprint of the token
+        self._cache_scope = (
+            hashlib.sha256(self._token.encode()).hexdigest()[:8] if self._token else "anon"
+        )
+        # Built once; shared by every request, so never mutate it
+        self._request_headers = self._headers()
+        self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
 
         # Rate limit tracking
         self.rate_limit_remaining: int = 5000
         self.rate_limit_total: int = 5000
         self.rate_limit_reset: datetime | None = None
 
+        # Recursive trees keyed by (owner, repo, ref), shared by all file lookups
+        self._tree_cache: OrderedDict[tuple[str, str, str], asyncio.Future] = OrderedDict()
+        # Default branch per repo, so trees fetched by branch name and HEAD are shared
+        self._default_branches: OrderedDict[tuple[str, str], str] = OrderedDict()
+        # Decoded file contents keyed by API path, shared by security, CI and LLM fetches
+        self._content_cache: OrderedDict[str, asyncio.Future] = OrderedDict()
+        # Contributor lists keyed by (owner, repo), shared by stats and maintainer detection
+        self._contributors_cache: OrderedDict[tuple[str, str], asyncio.Future] = OrderedDict()
+        # Commit summaries keyed by (owner, repo, since), shared by contributor,
+        # activity and signed-commit stats
+        self._commits_cache: OrderedDict[tuple[str, str, str], asyncio.Future] = OrderedDict()
+
     def _headers(self) -> dict[str, str]:
         """Get headers for GitHub API requests."""
         headers = {
@@ -59,13 +390,52 @@ class GitHubFetcher:
         return headers
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create an HTTP client."""
+        """Get the injected HTTP client, or the pooled one owned by this fetcher."""
         if self._client is not None:
             return self._client
-        return httpx.AsyncClient(timeout=30.0, headers=self._headers(), follow_redirects=True)
+        if self._owned_client is None or self._owned_client.is_closed:
+            self._owned_client = httpx.AsyncClient(
+                timeout=30.0,
+                headers=self._request_headers,
+                follow_redirects=True,
+                # Keep idle connections for a while so back-to-back analyses
+                # (the daemon, batch scans) don't redo the TLS handshake
+                limits=httpx.Limits(
+                    max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0
+                ),
+                # Multiplex requests over one connection when h2 is installed
+                http2=importlib.util.find_spec("h2") is not None,
+            )
+        return self._owned_client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client, if this fetcher created one."""
+        if self._owned_client is not None:
+            await self._owned_client.aclose()
+            self._owned_client = None
+
+    def clear_cache(self) -> None:
+        """Drop all cached responses and file contents."""
+        self._tree_cache.clear()
+        self._content_cache.clear()
+        self._contributors_cache.clear()
+        self._commits_cache.clear()
+        if self._cache is not None:
+            self._cache.clear()
+
+    async def __aenter__(self) -> "GitHubFetcher":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
 
     def _update_rate_limits(self, response: httpx.Response) -> None:
         """Extract and store rate limit info from response headers."""
+        # GraphQL and search have their own budgets; only track the core REST limit
+        resource = response.headers.get("X-RateLimit-Resource")
+        if resource is not None and resource != "core":
+            return
+
         remaining = response.headers.get("X-RateLimit-Remaining")
         limit = response.headers.get("X-RateLimit-Limit")
         reset = response.headers.get("X-RateLimit-Reset")
@@ -77,64 +447,452 @@ class GitHubFetcher:
         if reset is not None:
             self.rate_limit_reset = datetime.fromtimestamp(int(reset), tz=timezone.utc)
 
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float | None:
+        """Return how long to wait before retrying, or None if it shouldn't be retried.
+
+        Exhausting the primary rate limit is not retried here; the caller (and
+        the daemon's rate limit handling) deals with that.
+        """
+        status = response.status_code
+        if status == 403:
+            if response.headers.get("X-RateLimit-Remaining") == "0":
+                return None
+            secondary = "Retry-After" in response.headers or (
+                "secondary rate limit" in response.text.lower()
+            )
+            if not secondary:
+                return None
+        elif status not in self.RETRY_STATUSES:
+            return None
+
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), self.MAX_RETRY_DELAY)
+            except ValueError:
+                pass
+        return min(self.RETRY_BASE_DELAY * 2**attempt, self.MAX_RETRY_DELAY)
+
+    async def _request(
+        self, client: httpx.AsyncClient, method: str, url: str, **kwargs: Any
+    ) -> httpx.Response:
+        """Send a request, bounded by the concurrency limit.
+
+        Retries with backoff on 5xx gateway errors, 429s, secondary rate limits
+        and connection errors; the last response is returned as-is.
+        """
+        attempt = 0
+        while True:
+            try:
+                async with self._semaphore:
+                    response = await client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                if attempt >= self.MAX_RETRIES:
+                    raise
+                delay = min(self.RETRY_BASE_DELAY * 2**attempt, self.MAX_RETRY_DELAY)
+                reason = repr(e)
+            else:
+                self._update_rate_limits(response)
+                delay = self._retry_delay(response, attempt)
+                if delay is None or attempt >= self.MAX_RETRIES:
+                    return response
+                reason = str(response.status_code)
+
+            logger.debug(f"GitHub request failed ({reason}), retrying in {delay:.0f}s: {url}")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _get(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        params: dict | None,
+        raw: bool = False,
+    ) -> tuple[Any, httpx.Response | None]:
+        """GET a resource, going through the response cache if configured.
+
+        Returns the decoded JSON body (or the raw bytes if raw is set; None if
+        404) and the response, which is None when a fresh cached body was used
+        without contacting GitHub.
+        """
+        headers = self._request_headers
+        if raw:
+            headers = {**headers, "Accept": self.RAW_MEDIA_TYPE}
+        decode = bytes if raw else _loads
+
+        cache = self._cache
+        key = ResponseCache.make_key(self._cache_scope, "GET", url, params, raw)
+        cached = None
+        if cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                ttl = self.REVALIDATE_AFTER if cached.etag else self.CACHE_TTL
+                if cached.age() < ttl:
+                    return decode(cached.body), None
+                if cached.etag:
+                    headers = {**headers, "If-None-Match": cached.etag}
+
+        response = await self._request(client, "GET", url, params=params, headers=headers)
+        # Status handling is only needed off the common 2xx path
+        if not response.is_success:
+            if response.status_code == 304 and cache is not None and cached is not None:
+                cache.touch(key)
+                return decode(cached.body), response
+            if response.status_code == 404:
+                return None, response
+            response.raise_for_status()
+        if cache is not None:
+            cache.set(key, response.content, response.headers.get("ETag"))
+        return decode(response.content), response
+
+    async def _graphql(self, query: str, variables: dict) -> dict:
+        """Run a GraphQL query and return the full payload (data and errors).
+
+        Raises on HTTP errors. GraphQL requires authentication.
+        """
+        client = await self._get_client()
+        response = await self._request(
+            client,
+            "POST",
+            f"{self.BASE_URL}/graphql",
+            json={"query": query, "variables": variables},
+            headers=self._request_headers,
+        )
+        if not response.is_success:
+            response.raise_for_status()
+        return _loads(response.content)
+
     async def _fetch(self, path: str, params: dict | None = None) -> dict | list | None:
         """Fetch from GitHub API.
 
         Returns None if 404, raises on other errors.
         """
         client = await self._get_client()
-        url = f"{self.BASE_URL}{path}"
-
-        try:
-            response = await client.get(url, params=params, headers=self._headers())
-            self._update_rate_limits(response)
-            if response.status_code == 404:
-                return None
-            response.raise_for_status()
-            return response.json()
-        finally:
-            if self._client is None:
-                await client.aclose()
+        data, _ = await self._get(client, f"{self.BASE_URL}{path}", params)
+        return data
 
     async def _fetch_all_pages(
         self,
         path: str,
         params: dict | None = None,
         max_pages: int = 10,
+        project: Callable[[Any], Any] | None = None,
     ) -> list:
-        """Fetch all pages from a paginated endpoint."""
+        """Fetch all pages from a paginated endpoint.
+
+        When the first page has a Link rel="last" header, the remaining pages
+        are fetched concurrently; otherwise they are walked one at a time.
+
+        If ``project`` is given, each item is passed through it as its page
+        arrives and only the projected values are kept, so the full decoded
+        pages can be freed early.
+        """
         client = await self._get_client()
         url = f"{self.BASE_URL}{path}"
-        params = params or {}
+        params = dict(params or {})
         params.setdefault("per_page", 100)
+        per_page = params["per_page"]
+
+        async def get_page(page: int) -> tuple[list | None, httpx.Response | None]:
+            return await self._get(client, url, {**params, "page": page})
 
         results = []
-        page = 1
 
-        try:
-            while page <= max_pages:
-                params["page"] = page
-                response = await client.get(url, params=params, headers=self._headers())
-                self._update_rate_limits(response)
-                if response.status_code == 404:
-                    break
-                response.raise_for_status()
+        def collect(data: list) -> None:
+            results.extend(data if project is None else map(project, data))
+
+        data, first_response = await get_page(1)
+        if not data:
+            return []
+        collect(data)
+        if len(data) < per_page:
+            return results
 
-                data = response.json()
+        last_page = self._last_page(first_response) if first_response is not None else None
+        if last_page is not None:
+            semaphore = asyncio.Semaphore(self.PAGE_CONCURRENCY)
+
+            async def bounded(page: int) -> list | None:
+                async with semaphore:
+                    data, _ = await get_page(page)
+                    return data
+
+            pages = await _gather(
+                *(bounded(page) for page in range(2, min(last_page, max_pages) + 1))
+            )
+            for data in pages:
                 if not data:
                     break
+                collect(data)
+                if len(data) < per_page:
+                    break
+            return results
 
-                results.extend(data)
+        page = 2
+        while page <= max_pages:
+            data, _ = await get_page(page)
+            if not data:
+                break
 
-                # Check if there are more pages
-                if len(data) < params["per_page"]:
-                    break
-                page += 1
+            collect(data)
 
-            return results
-        finally:
-            if self._client is None:
-                await client.aclose()
+            # Check if there are more pages
+            if len(data) < per_page:
+                break
+            page += 1
+
+        return results
+
+    async def _fetch_pages_until(
+        self,
+        path: str,
+        stop: Callable[[Any], bool],
+        params: dict | None = None,
+        max_pages: int = 10,
+        project: Callable[[Any], Any] | None = None,
+    ) -> list:
+        """Fetch pages in order until stop() is true for the last item of a page.
+
+        For endpoints sorted so that once one item is past a cutoff every later
+        item is too; the remaining pages are never requested. stop() sees the
+        unprojected item; ``project`` works as in _fetch_all_pages.
+        """
+        client = await self._get_client()
+        url = f"{self.BASE_URL}{path}"
+        params = dict(params or {})
+        params.setdefault("per_page", 100)
+        per_page = params["per_page"]
+
+        results = []
+        for page in range(1, max_pages + 1):
+            data, _ = await self._get(client, url, {**params, "page": page})
+            if not data:
+                break
+            results.extend(data if project is None else map(project, data))
+            if len(data) < per_page or stop(data[-1]):
+                break
+        return results
+
+    @staticmethod
+    def _last_page(response: httpx.Response) -> int | None:
+        """Get the last page number from a response's Link header, if present."""
+        last_url = response.links.get("last", {}).get("url")
+        if not last_url:
+            return None
+        try:
+            return int(httpx.URL(last_url).params.get("page", ""))
+        except ValueError:
+            return None
+
+    async def _memoize(
+        self,
+        cache: OrderedDict,
+        key: Any,
+        factory: Callable[[], Awaitable[Any]],
+        maxsize: int,
+    ) -> Any:
+        """Run factory() once per key and share the result with concurrent callers.
+
+        The cache is a small LRU; failed fetches are dropped so they can be retried.
+        """
+        future = cache.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            cache[key] = future
+            while len(cache) > maxsize:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+
+        try:
+            # Shield so one cancelled caller doesn't cancel the shared fetch
+            return await asyncio.shield(future)
+        except Exception:
+            if cache.get(key) is future:
+                del cache[key]
+            raise
+
+    async def _fetch_tree(self, owner: str, repo: str, ref: str = "HEAD") -> RepoTree | None:
+        """Fetch the recursive git tree for a ref (cached).
+
+        Trees for the default branch are shared between callers that ask for
+        it by name and callers that ask for HEAD.
+        """
+        if ref == self._default_branches.get((owner, repo)):
+            ref = "HEAD"
+
+        async def load() -> RepoTree | None:
+            try:
+                data = await self._fetch(
+                    f"/repos/{owner}/{repo}/git/trees/{ref}",
+                    params={"recursive": "1"},
+                )
+            except httpx.HTTPStatusError as e:
+                # Empty repositories have no tree
+                if e.response.status_code == 409:
+                    return None
+                raise
+            if not data or not isinstance(data, dict) or "tree" not in data:
+                return None
+            return RepoTree(
+                entries={item.get("path", ""): item for item in data["tree"]},
+                truncated=bool(data.get("truncated")),
+            )
+
+        return await self._memoize(
+            self._tree_cache, (owner, repo, ref), load, self.TREE_CACHE_SIZE
+        )
+
+    async def _fetch_contributors(self, owner: str, repo: str) -> list[dict]:
+        """Fetch up to 500 contributors, most contributions first."""
+
+        async def load() -> list[dict]:
+            return await self._fetch_all_pages(
+                f"/repos/{owner}/{repo}/contributors",
+                max_pages=5,
+            )
+
+        return await self._memoize(
+            self._contributors_cache, (owner, repo), load, self.REPO_LIST_CACHE_SIZE
+        )
+
+    async def _fetch_commits(
+        self, owner: str, repo: str, since: str
+    ) -> list[tuple[str | None, str | None, bool]]:
+        """Fetch up to 1000 commits since a date, newest first, as _commit_summary tuples."""
+
+        async def load() -> list[tuple[str | None, str | None, bool]]:
+            return await self._fetch_all_pages(
+                f"/repos/{owner}/{repo}/commits",
+                params={"since": since},
+                max_pages=10,
+                project=_commit_summary,
+            )
+
+        return await self._memoize(
+            self._commits_cache, (owner, repo, since), load, self.REPO_LIST_CACHE_SIZE
+        )
+
+    async def _fetch_blob_texts(self, owner: str, repo: str, shas: list[str]) -> list[str | None]:
+        """Fetch git blobs as UTF-8 text; None for binary or undecodable ones.
+
+        With a token the whole batch is one GraphQL query (a single point of
+        the GraphQL budget instead of a REST request per blob). Without one,
+        or if GraphQL fails, each blob is fetched through REST.
+        """
+        if self._token and shas:
+            params = "".join(f", $b{i}: GitObjectID!" for i in range(len(shas)))
+            fields = "\n".join(
+                f"    b{i}: object(oid: $b{i}) {{ ... on Blob {{ text isBinary }} }}"
+                for i in range(len(shas))
+            )
+            query = (
+                f"query($owner: String!, $name: String!{params}) {{\n"
+                f"  repository(owner: $owner, name: $name) {{\n{fields}\n  }}\n}}"
+            )
+            variables = {"owner": owner, "name": repo}
+            variables.update({f"b{i}": sha for i, sha in enumerate(shas)})
+            try:
+                payload = await self._graphql(query, variables)
+            except httpx.HTTPStatusError:
+                payload = {}
+            node = (payload.get("data") or {}).get("repository")
+            if node is not None:
+                texts = []
+                for i in range(len(shas)):
+                    blob = node.get(f"b{i}") or {}
+                    texts.append(None if blob.get("isBinary") else blob.get("text") or None)
+                return texts
+
+        blobs = await _gather(
+            *(self._fetch(f"/repos/{owner}/{repo}/git/blobs/{sha}") for sha in shas)
+        )
+        return [_b64_text(blob) for blob in blobs]
+
+    async def _fetch_text(self, path: str) -> str | None:
+        """Fetch a contents-API file as text (cached).
+
+        Requests the raw media type, so the body isn't base64-wrapped JSON.
+        Returns None if the file is missing, empty or isn't valid UTF-8.
+        """
+
+        async def load() -> str | None:
+            client = await self._get_client()
+            body, _ = await self._get(client, f"{self.BASE_URL}{path}", None, raw=True)
+            if not body:
+                return None
+            try:
+                return body.decode("utf-8")
+            except UnicodeDecodeError:
+                return None
+
+        return await self._memoize(self._content_cache, path, load, self.CONTENT_CACHE_SIZE)
+
+    async def _existing_paths(self, owner: str, repo: str, candidates: list[str]) -> list[str]:
+        """Filter candidate file paths down to those present in the repo tree.
+
+        Falls back to all candidates when the tree is unavailable or truncated,
+        so callers simply probe each one as before.
+        """
+        tree = await self._fetch_tree(owner, repo)
+        if tree is None or tree.truncated:
+            return candidates
+        return [
+            path for path in candidates
+            if tree.entries.get(path, {}).get("type") == "blob"
+        ]
+
+    async def _find_files(self, owner: str, repo: str, candidates: list[str]) -> set[str]:
+        """Return which candidate files exist.
+
+        Answered from the cached tree; each candidate is probed through the
+        contents API only when the tree is unavailable or truncated.
+        """
+        tree = await self._fetch_tree(owner, repo)
+        if tree is not None and not tree.truncated:
+            return {
+                path for path in candidates
+                if tree.entries.get(path, {}).get("type") == "blob"
+            }
+        found = await _gather(
+            *(self._fetch(f"/repos/{owner}/{repo}/contents/{path}") for path in candidates)
+        )
+        return {path for path, data in zip(candidates, found, strict=True) if data is not None}
+
+    async def _list_dir(self, owner: str, repo: str, path: str = "") -> list[dict] | None:
+        """List a directory like the contents API does, using the cached tree.
+
+        Items carry name, path, type ("file", "dir", "symlink" or "submodule")
+        and size. Returns None if the directory doesn't exist.
+        """
+        tree = await self._fetch_tree(owner, repo)
+        if tree is None or tree.truncated:
+            suffix = f"/{path}" if path else ""
+            listing = await self._fetch(f"/repos/{owner}/{repo}/contents{suffix}")
+            return listing if isinstance(listing, list) else None
+
+        if path and tree.entries.get(path, {}).get("type") != "tree":
+            return None
+
+        # The tree indexes entries by directory once, so repeated listings
+        # don't each scan every path in the repo
+        items = []
+        for name, entry in tree.children(path):
+            if entry.get("type") == "tree":
+                item_type = "dir"
+            elif entry.get("type") == "commit":
+                item_type = "submodule"
+            elif entry.get("mode") == "120000":
+                item_type = "symlink"
+            else:
+                item_type = "file"
+            items.append({
+                "name": name,
+                "path": entry.get("path", ""),
+                "type": item_type,
+                "size": entry.get("size", 0),
+            })
+        return items
 
     async def fetch_repo_data(self, repo_ref: RepoRef) -> GitHubData | None:
         """Fetch all available data for a GitHub repository.
@@ -148,20 +906,53 @@ class GitHubFetcher:
         owner = repo_ref.owner
         repo = repo_ref.repo
 
-        # Fetch basic repo info first
-        repo_data = await self._fetch_repo_info(owner, repo)
+        cutoffs = _TimeCutoffs.current()
+
+        # Fetch basic repo info first (with releases and open issue/PR counts,
+        # when GraphQL is available). The tree doesn't depend on it, so load it
+        # into the cache meanwhile for the file checks below.
+        (repo_data, releases, open_counts), _ = await _gather(
+            self._fetch_repo_overview(owner, repo, cutoffs),
+            self._fetch_tree(owner, repo),
+        )
         if repo_data is None:
             return None
-
-        # Fetch additional data in parallel would be better, but for simplicity:
-        contributors = await self._fetch_contributor_stats(owner, repo)
-        commits = await self._fetch_commit_activity(owner, repo)
-        issues = await self._fetch_issue_stats(owner, repo)
-        prs = await self._fetch_pr_stats(owner, repo)
-        releases = await self._fetch_release_stats(owner, repo)
-        security = await self._fetch_security_data(owner, repo)
-        files = await self._fetch_repo_files(owner, repo, repo_data.default_branch)
-        ci = await self._fetch_ci_status(owner, repo)
+        if open_counts is None and repo_data.open_issues == 0:
+            # REST only reports issues and PRs together, but zero means zero of each
+            open_counts = _OpenCounts(issues=0, pull_requests=0)
+
+        self._default_branches[(owner, repo)] = repo_data.default_branch
+        while len(self._default_branches) > self.TREE_CACHE_SIZE:
+            self._default_branches.popitem(last=False)
+
+        # The remaining endpoints are independent of each other
+        (
+            contributors,
+            commits,
+            issues,
+            prs,
+            releases,
+            security,
+            files,
+            ci,
+        ) = await _gather(
+            self._fetch_contributor_stats(owner, repo, cutoffs),
+            self._fetch_commit_activity(owner, repo, cutoffs),
+            self._fetch_issue_stats(
+                owner, repo, cutoffs, open_counts.issues if open_counts else None
+            ),
+            self._fetch_pr_stats(
+                owner, repo, cutoffs, open_counts.pull_requests if open_counts else None
+            ),
+            (
+                self._fetch_release_stats(owner, repo, cutoffs)
+                if releases is None
+                else _value(releases)
+            ),
+            self._fetch_security_data(owner, repo, cutoffs),
+            self._fetch_repo_files(owner, repo, repo_data.default_branch),
+            self._fetch_ci_status(owner, repo),
+        )
 
         return GitHubData(
             repo=repo_data,
@@ -175,23 +966,102 @@ class GitHubFetcher:
             ci=ci,
         )
 
+    async def _fetch_repo_overview(
+        self, owner: str, repo: str, cutoffs: _TimeCutoffs | None = None
+    ) -> tuple[GitHubRepoData | None, ReleaseStats | None, _OpenCounts | None]:
+        """Fetch repository info, release stats and open issue/PR counts with
+        one GraphQL query.
+
+        Release stats are only returned when every release fit in the query;
+        otherwise (and without a token, or if GraphQL fails) the caller falls
+        back to the REST endpoints. The open counts are None in that case.
+        """
+        if not self._token:
+            return await self._fetch_repo_info(owner, repo), None, None
+
+        try:
+            payload = await self._graphql(
+                _REPO_OVERVIEW_QUERY, {"owner": owner, "name": repo}
+            )
+        except httpx.HTTPStatusError:
+            return await self._fetch_repo_info(owner, repo), None, None
+
+        node = (payload.get("data") or {}).get("repository")
+        if node is None:
+            errors = payload.get("errors") or []
+            if errors and all(e.get("type") == "NOT_FOUND" for e in errors):
+                return None, None, None
+            return await self._fetch_repo_info(owner, repo), None, None
+
+        open_counts = _OpenCounts(
+            issues=(node.get("issues") or {}).get("totalCount", 0),
+            pull_requests=(node.get("pullRequests") or {}).get("totalCount", 0),
+        )
+
+        # Reshape into the REST representation so both paths share one parser
+        repo_data = self._build_repo_data(owner, repo, {
+            "description": node.get("description"),
+            "stargazers_count": node.get("stargazerCount", 0),
+            "forks_count": node.get("forkCount", 0),
+            # REST counts open PRs as issues, and watchers_count mirrors stars
+            "open_issues_count": open_counts.issues + open_counts.pull_requests,
+            "watchers_count": node.get("stargazerCount", 0),
+            "created_at": node.get("createdAt"),
+            "updated_at": node.get("updatedAt"),
+            "pushed_at": node.get("pushedAt"),
+            "default_branch": (node.get("defaultBranchRef") or {}).get("name", "main"),
+            "license": {"spdx_id": (node.get("licenseInfo") or {}).get("spdxId")},
+            "language": (node.get("primaryLanguage") or {}).get("name"),
+            "topics": [
+                t["topic"]["name"]
+                for t in (node.get("repositoryTopics") or {}).get("nodes", [])
+            ],
+            "archived": node.get("isArchived", False),
+            "fork": node.get("isFork", False),
+            "has_discussions": node.get("hasDiscussionsEnabled", False),
+        })
+
+        release_conn = node.get("releases") or {}
+        release_nodes = release_conn.get("nodes", [])
+        # Leave release stats to the REST path when the overview is cut short,
+        # either more releases or a release with more assets (signatures could
+        # be among the missing ones)
+        if release_conn.get("pageInfo", {}).get("hasNextPage") or any(
+            ((r.get("releaseAssets") or {}).get("pageInfo") or {}).get("hasNextPage")
+            for r in release_nodes
+        ):
+            return repo_data, None, open_counts
+        release_stats = self._build_release_stats([
+            {
+                "tag_name": r.get("tagName"),
+                "published_at": r.get("publishedAt"),
+                "prerelease": r.get("isPrerelease", False),
+                "assets": (r.get("releaseAssets") or {}).get("nodes", []),
+            }
+            for r in release_nodes
+        ], cutoffs)
+        return repo_data, release_stats, open_counts
+
     async def _fetch_repo_info(self, owner: str, repo: str) -> GitHubRepoData | None:
         """Fetch basic repository information."""
         data = await self._fetch(f"/repos/{owner}/{repo}")
         if data is None:
             return None
+        return self._build_repo_data(owner, repo, data)
 
+    def _build_repo_data(self, owner: str, repo: str, data: dict) -> GitHubRepoData:
+        """Build GitHubRepoData from a REST repository object."""
         created_at = None
         if data.get("created_at"):
-            created_at = datetime.fromisoformat(data["created_at"].replace("Z", "+00:00"))
+            created_at = _parse_datetime(data["created_at"])
 
         updated_at = None
         if data.get("updated_at"):
-            updated_at = datetime.fromisoformat(data["updated_at"].replace("Z", "+00:00"))
+            updated_at = _parse_datetime(data["updated_at"])
 
         pushed_at = None
         if data.get("pushed_at"):
-            pushed_at = datetime.fromisoformat(data["pushed_at"].replace("Z", "+00:00"))
+            pushed_at = _parse_datetime(data["pushed_at"])
 
         license_info = data.get("license") or {}
 
@@ -258,7 +1128,9 @@ class GitHubFetcher:
 
         return False
 
-    async def _fetch_contributor_stats(self, owner: str, repo: str) -> ContributorStats:
+    async def _fetch_contributor_stats(
+        self, owner: str, repo: str, cutoffs: _TimeCutoffs | None = None
+    ) -> ContributorStats:
         """Fetch contributor statistics with growth trajectory and entropy.
 
         Calculates:
@@ -266,12 +1138,7 @@ class GitHubFetcher:
         - Contributor growth trajectory (comparing 6mo periods)
         - Shannon entropy for bus factor assessment
         """
-        import math
-
-        contributors = await self._fetch_all_pages(
-            f"/repos/{owner}/{repo}/contributors",
-            max_pages=5,
-        )
+        contributors = await self._fetch_contributors(owner, repo)
 
         if not contributors:
             return ContributorStats()
@@ -286,44 +1153,36 @@ class GitHubFetcher:
         top_contributions = contributors[0].get("contributions", 0) if contributors else 0
         top_pct = (top_contributions / total_contributions * 100) if total_contributions > 0 else 0
 
-        # Count contributors with >5% of commits
+        # Count contributors with >5% of commits. The list is sorted by
+        # contributions, most first, so stop at the first one below threshold
         threshold = total_contributions * 0.05
-        over_5pct = sum(1 for c in contributors if c.get("contributions", 0) >= threshold)
+        over_5pct = 0
+        for c in contributors:
+            if c.get("contributions", 0) < threshold:
+                break
+            over_5pct += 1
 
         # Calculate Shannon entropy for contributor distribution
         # Higher entropy = better distribution = lower bus factor risk
         entropy = self._calculate_contributor_entropy(contributors, total_contributions)
 
         # Get active contributors by time period from commit activity
-        now = datetime.now(timezone.utc)
-        six_months_ago = now - timedelta(days=180)
-        twelve_months_ago = now - timedelta(days=365)
+        cutoffs = cutoffs or _TimeCutoffs.current()
+        six_months_ago = cutoffs.six_months_ago
+        twelve_months_ago = cutoffs.one_year_ago
 
         # Fetch commits to determine active contributors by period
-        commits = await self._fetch_all_pages(
-            f"/repos/{owner}/{repo}/commits",
-            params={"since": twelve_months_ago.isoformat()},
-            max_pages=10,
-        )
+        commits = await self._fetch_commits(owner, repo, cutoffs.since_1y)
 
         active_6mo_set = set()
         active_prev_6mo_set = set()
         first_time_contributors = set()
 
-        for commit in commits:
-            author = commit.get("author")
-            if not author:
-                continue
-
-            author_login = author.get("login", "")
-            if not author_login:
-                continue
-
-            commit_date_str = commit.get("commit", {}).get("author", {}).get("date")
-            if not commit_date_str:
+        for author_login, commit_date_str, _ in commits:
+            if not author_login or not commit_date_str:
                 continue
 
-            commit_date = datetime.fromisoformat(commit_date_str.replace("Z", "+00:00"))
+            commit_date = _parse_datetime(commit_date_str)
 
             if commit_date >= six_months_ago:
                 active_6mo_set.add(author_login)
@@ -369,8 +1228,6 @@ class GitHubFetcher:
             Entropy value (0 = single contributor, higher = better distribution)
             Returns None if no data available.
         """
-        import math
-
         if not contributors or total_contributions == 0:
             return None
 
@@ -393,34 +1250,30 @@ class GitHubFetcher:
 
         return round(entropy, 2)
 
-    async def _fetch_commit_activity(self, owner: str, repo: str) -> CommitActivity:
+    async def _fetch_commit_activity(
+        self, owner: str, repo: str, cutoffs: _TimeCutoffs | None = None
+    ) -> CommitActivity:
         """Fetch commit activity statistics."""
+        cutoffs = cutoffs or _TimeCutoffs.current()
+
         # Get recent commits
-        since = (datetime.now(timezone.utc) - timedelta(days=365)).isoformat()
-        commits = await self._fetch_all_pages(
-            f"/repos/{owner}/{repo}/commits",
-            params={"since": since},
-            max_pages=10,
-        )
+        commits = await self._fetch_commits(owner, repo, cutoffs.since_1y)
 
         if not commits:
             return CommitActivity()
 
         # Parse last commit date
         last_commit_date = None
-        if commits and commits[0].get("commit", {}).get("author", {}).get("date"):
-            date_str = commits[0]["commit"]["author"]["date"]
-            last_commit_date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+        if commits[0][1]:
+            last_commit_date = _parse_datetime(commits[0][1])
 
         # Count commits in time periods
-        now = datetime.now(timezone.utc)
-        six_months_ago = now - timedelta(days=180)
+        six_months_ago = cutoffs.six_months_ago
 
         commits_6mo = 0
-        for commit in commits:
-            date_str = commit.get("commit", {}).get("author", {}).get("date")
+        for _, date_str, _ in commits:
             if date_str:
-                commit_date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+                commit_date = _parse_datetime(date_str)
                 if commit_date >= six_months_ago:
                     commits_6mo += 1
 
@@ -430,44 +1283,65 @@ class GitHubFetcher:
             commits_last_year=len(commits),
         )
 
-    async def _fetch_issue_stats(self, owner: str, repo: str) -> IssueStats:
-        """Fetch issue statistics including response time metrics."""
-        # Get open issues
-        open_issues = await self._fetch_all_pages(
-            f"/repos/{owner}/{repo}/issues",
-            params={"state": "open", "per_page": 100},
-            max_pages=3,
-        )
-        # Filter out pull requests (they're included in issues endpoint)
-        open_issues = [i for i in open_issues if "pull_request" not in i]
-
-        # Get recently closed issues
-        since = (datetime.now(timezone.utc) - timedelta(days=180)).isoformat()
-        closed_issues = await self._fetch_all_pages(
-            f"/repos/{owner}/{repo}/issues",
-            params={"state": "closed", "since": since, "per_page": 100},
-            max_pages=3,
-        )
-        closed_issues = [i for i in closed_issues if "pull_request" not in i]
+    async def _fetch_issue_stats(
+        self,
+        owner: str,
+        repo: str,
+        cutoffs: _TimeCutoffs | None = None,
+        open_issue_count: int | None = None,
+    ) -> IssueStats:
+        """Fetch issue statistics including response time metrics.
 
-        # Count good first issues
-        good_first_count = sum(
-            1
-            for i in open_issues
-            if any(
-                label.get("name", "").lower() in ("good first issue", "good-first-issue")
-                for label in i.get("labels", [])
-            )
+        Open issues aren't listed when ``open_issue_count`` is known to be zero.
+        """
+        cutoffs = cutoffs or _TimeCutoffs.current()
+
+        # Get open issues and recently closed issues
+        open_issues, closed_issues = await _gather(
+            (
+                _value([])
+                if open_issue_count == 0
+                else self._fetch_all_pages(
+                    f"/repos/{owner}/{repo}/issues",
+                    params={"state": "open", "per_page": 100},
+                    max_pages=3,
+                    project=_issue_fields,
+                )
+            ),
+            self._fetch_all_pages(
+                f"/repos/{owner}/{repo}/issues",
+                params={"state": "closed", "since": cutoffs.since_6mo, "per_page": 100},
+                max_pages=3,
+                project=_issue_fields,
+            ),
         )
+        # Count in a single pass, skipping pull requests (they're included in
+        # the issues endpoint)
+        open_count = 0
+        good_first_count = 0
+        regression_count = 0
+        for issue in open_issues:
+            if "pull_request" in issue:
+                continue
+            open_count += 1
+            has_good_first = has_regression = False
+            for label in issue.get("labels", ()):
+                name = label.get("name", "").lower()
+                if name in _GOOD_FIRST_LABELS:
+                    has_good_first = True
+                if "regression" in name:
+                    has_regression = True
+                if has_good_first and has_regression:
+                    break
+            good_first_count += has_good_first
+            regression_count += has_regression
 
-        # Count regression issues
-        regression_count = sum(
-            1
-            for i in open_issues + closed_issues
-            if any(
-                "regression" in label.get("name", "").lower() for label in i.get("labels", [])
-            )
-        )
+        closed_issues = [i for i in closed_issues if "pull_request" not in i]
+        for issue in closed_issues:
+            for label in issue.get("labels", ()):
+                if "regression" in label.get("name", "").lower():
+                    regression_count += 1
+                    break
 
         # Calculate response time and close time for closed issues
         avg_response_hours, avg_close_hours = await self._calculate_issue_response_times(
@@ -475,7 +1349,7 @@ class GitHubFetcher:
         )
 
         return IssueStats(
-            open_issues=len(open_issues),
+            open_issues=open_count if open_issue_count is None else open_issue_count,
             closed_issues_6mo=len(closed_issues),
             good_first_issue_count=good_first_count,
             regression_issue_count=regression_count,
@@ -505,11 +1379,11 @@ class GitHubFetcher:
             if not created_at_str:
                 continue
 
-            created_at = datetime.fromisoformat(created_at_str.replace("Z", "+00:00"))
+            created_at = _parse_datetime(created_at_str)
 
             # Calculate close time
             if closed_at_str:
-                closed_at = datetime.fromisoformat(closed_at_str.replace("Z", "+00:00"))
+                closed_at = _parse_datetime(closed_at_str)
                 close_hours = (closed_at - created_at).total_seconds() / 3600
                 close_times.append(close_hours)
 
@@ -523,9 +1397,7 @@ class GitHubFetcher:
                 first_comment = comments[0]
                 comment_created_str = first_comment.get("created_at")
                 if comment_created_str:
-                    comment_created = datetime.fromisoformat(
-                        comment_created_str.replace("Z", "+00:00")
-                    )
+                    comment_created = _parse_datetime(comment_created_str)
                     response_hours = (comment_created - created_at).total_seconds() / 3600
                     response_times.append(response_hours)
 
@@ -537,25 +1409,73 @@ class GitHubFetcher:
             round(avg_close, 1) if avg_close else None,
         )
 
-    async def _fetch_pr_stats(self, owner: str, repo: str) -> PRStats:
-        """Fetch pull request statistics."""
-        # Get open PRs
-        open_prs = await self._fetch_all_pages(
-            f"/repos/{owner}/{repo}/pulls",
-            params={"state": "open", "per_page": 100},
-            max_pages=3,
-        )
+    async def _fetch_pr_stats(
+        self,
+        owner: str,
+        repo: str,
+        cutoffs: _TimeCutoffs | None = None,
+        open_pr_count: int | None = None,
+    ) -> PRStats:
+        """Fetch pull request statistics.
 
-        # Get recently closed PRs
-        closed_prs = await self._fetch_all_pages(
-            f"/repos/{owner}/{repo}/pulls",
-            params={"state": "closed", "per_page": 100},
-            max_pages=3,
-        )
+        When the number of open PRs is already known (from the GraphQL
+        overview), only the open PRs old enough to be stale are listed.
+        """
+        cutoffs = cutoffs or _TimeCutoffs.current()
+        six_months_ago = cutoffs.six_months_ago
+        ninety_days_ago = cutoffs.ninety_days_ago
 
-        now = datetime.now(timezone.utc)
-        six_months_ago = now - timedelta(days=180)
-        ninety_days_ago = now - timedelta(days=90)
+        def updated_before_cutoff(pr: dict) -> bool:
+            updated_str = pr.get("updated_at")
+            return bool(updated_str) and _parse_datetime(updated_str) < six_months_ago
+
+        def created_after_stale_cutoff(pr: dict) -> bool:
+            created_str = pr.get("created_at")
+            return bool(created_str) and _parse_datetime(created_str) >= ninety_days_ago
+
+        if open_pr_count is None:
+            open_prs_fetch = self._fetch_all_pages(
+                f"/repos/{owner}/{repo}/pulls",
+                params={"state": "open", "per_page": 100},
+                max_pages=3,
+                project=_pr_fields,
+            )
+        elif open_pr_count == 0:
+            open_prs_fetch = _value([])
+        else:
+            # Oldest first, stopping at the first page that reaches PRs too
+            # recent to be stale
+            open_prs_fetch = self._fetch_pages_until(
+                f"/repos/{owner}/{repo}/pulls",
+                stop=created_after_stale_cutoff,
+                params={
+                    "state": "open",
+                    "sort": "created",
+                    "direction": "asc",
+                    "per_page": 100,
+                },
+                max_pages=3,
+                project=_pr_fields,
+            )
+
+        # Get open PRs and recently closed PRs. Closed PRs come most recently
+        # updated first; since closed_at <= updated_at, paging stops once a
+        # PR was last updated before the 6-month window.
+        open_prs, closed_prs = await _gather(
+            open_prs_fetch,
+            self._fetch_pages_until(
+                f"/repos/{owner}/{repo}/pulls",
+                stop=updated_before_cutoff,
+                params={
+                    "state": "closed",
+                    "sort": "updated",
+                    "direction": "desc",
+                    "per_page": 100,
+                },
+                max_pages=3,
+                project=_pr_fields,
+            ),
+        )
 
         # Count merged and closed PRs in last 6 months
         # Some projects (like OpenSSL) merge via CLI, so merged_at is never populated
@@ -565,7 +1485,7 @@ class GitHubFetcher:
         for pr in closed_prs:
             closed_str = pr.get("closed_at")
             if closed_str:
-                closed_at = datetime.fromisoformat(closed_str.replace("Z", "+00:00"))
+                closed_at = _parse_datetime(closed_str)
                 if closed_at >= six_months_ago:
                     closed_6mo += 1
                     # Also track if merged via GitHub merge button
@@ -577,29 +1497,35 @@ class GitHubFetcher:
         for pr in open_prs:
             created_str = pr.get("created_at")
             if created_str:
-                created_at = datetime.fromisoformat(created_str.replace("Z", "+00:00"))
+                created_at = _parse_datetime(created_str)
                 if created_at < ninety_days_ago:
                     stale_count += 1
 
         return PRStats(
-            open_prs=len(open_prs),
+            open_prs=len(open_prs) if open_pr_count is None else open_pr_count,
             merged_prs_6mo=merged_6mo,
             closed_prs_6mo=closed_6mo,
             stale_prs=stale_count,
         )
 
-    async def _fetch_release_stats(self, owner: str, repo: str) -> ReleaseStats:
+    async def _fetch_release_stats(
+        self, owner: str, repo: str, cutoffs: _TimeCutoffs | None = None
+    ) -> ReleaseStats:
         """Fetch release statistics."""
         releases = await self._fetch_all_pages(
             f"/repos/{owner}/{repo}/releases",
             max_pages=5,
         )
+        return self._build_release_stats(releases, cutoffs)
 
+    def _build_release_stats(
+        self, releases: list[dict], cutoffs: _TimeCutoffs | None = None
+    ) -> ReleaseStats:
+        """Build ReleaseStats from REST release objects, newest first."""
         if not releases:
             return ReleaseStats()
 
-        now = datetime.now(timezone.utc)
-        one_year_ago = now - timedelta(days=365)
+        one_year_ago = (cutoffs or _TimeCutoffs.current()).one_year_ago
 
         # Count releases in last year
         releases_last_year = 0
@@ -609,27 +1535,24 @@ class GitHubFetcher:
         latest_version = None
 
         for i, release in enumerate(releases):
+            published_str = release.get("published_at")
+            published = _parse_datetime(published_str) if published_str else None
             if i == 0:
                 latest_version = release.get("tag_name")
-                if release.get("published_at"):
-                    last_release_date = datetime.fromisoformat(
-                        release["published_at"].replace("Z", "+00:00")
-                    )
+                last_release_date = published
 
-            published_str = release.get("published_at")
-            if published_str:
-                published = datetime.fromisoformat(published_str.replace("Z", "+00:00"))
-                if published >= one_year_ago:
-                    releases_last_year += 1
+            if published is not None and published >= one_year_ago:
+                releases_last_year += 1
 
             if release.get("prerelease"):
                 prerelease_count += 1
 
-            # Check for signatures in assets
-            for asset in release.get("assets", []):
-                name = asset.get("name", "").lower()
-                if any(ext in name for ext in [".sig", ".asc", ".sign"]):
-                    has_signed = True
+            # Check for signatures in assets; one signed release is enough
+            if not has_signed:
+                has_signed = any(
+                    _SIGNATURE_RE.search(asset.get("name", ""))
+                    for asset in release.get("assets", [])
+                )
 
         total = len(releases)
         prerelease_ratio = prerelease_count / total if total > 0 else 0
@@ -671,9 +1594,7 @@ class GitHubFetcher:
             published_str = release.get("published_at")
             if tag and published_str:
                 try:
-                    published = datetime.fromisoformat(
-                        published_str.replace("Z", "+00:00")
-                    )
+                    published = _parse_datetime(published_str)
                     release_dates[tag] = published
                     # Also store without 'v' prefix for matching
                     if tag.startswith("v"):
@@ -683,7 +1604,9 @@ class GitHubFetcher:
 
         return release_dates
 
-    async def _fetch_security_data(self, owner: str, repo: str) -> SecurityData:
+    async def _fetch_security_data(
+        self, owner: str, repo: str, cutoffs: _TimeCutoffs | None = None
+    ) -> SecurityData:
         """Fetch security-related data.
 
         Includes:
@@ -692,46 +1615,47 @@ class GitHubFetcher:
         - Signed commits percentage
         - Supply chain security signals (SLSA, Sigstore, SBOM)
         """
+        renovate_files = [
+            ".github/renovate.json",
+            ".github/renovate.json5",
+            "renovate.json",
+            "renovate.json5",
+            ".renovaterc",
+            ".renovaterc.json",
+        ]
+        present, community, workflows = await _gather(
+            self._find_files(
+                owner,
+                repo,
+                [
+                    "SECURITY.md",
+                    ".github/dependabot.yml",
+                    ".github/dependabot.yaml",
+                    *renovate_files,
+                ],
+            ),
+            self._fetch(f"/repos/{owner}/{repo}/community/profile"),
+            self._list_dir(owner, repo, ".github/workflows"),
+        )
+
         # Check for SECURITY.md
-        security_md = await self._fetch(f"/repos/{owner}/{repo}/contents/SECURITY.md")
-        has_security_md = security_md is not None
+        has_security_md = "SECURITY.md" in present
 
         # Check for security policy via community profile
-        community = await self._fetch(f"/repos/{owner}/{repo}/community/profile")
         has_security_policy = False
         if community and isinstance(community, dict):
             files = community.get("files", {})
             has_security_policy = files.get("security_policy") is not None
 
         # Check for Dependabot config
-        dependabot = await self._fetch(
-            f"/repos/{owner}/{repo}/contents/.github/dependabot.yml"
+        has_dependabot = (
+            ".github/dependabot.yml" in present or ".github/dependabot.yaml" in present
         )
-        has_dependabot = dependabot is not None
-        if not has_dependabot:
-            dependabot = await self._fetch(
-                f"/repos/{owner}/{repo}/contents/.github/dependabot.yaml"
-            )
-            has_dependabot = dependabot is not None
 
         # Check for Renovate config
-        has_renovate = False
-        renovate_files = [
-            ".github/renovate.json",
-            ".github/renovate.json5",
-            "renovate.json",
-            "renovate.json5",
-            ".renovaterc",
-            ".renovaterc.json",
-        ]
-        for renovate_file in renovate_files:
-            renovate = await self._fetch(f"/repos/{owner}/{repo}/contents/{renovate_file}")
-            if renovate is not None:
-                has_renovate = True
-                break
+        has_renovate = any(f in present for f in renovate_files)
 
-        # Check for workflows and detect security tools
-        workflows = await self._fetch(f"/repos/{owner}/{repo}/contents/.github/workflows")
+        # Detect security tools from workflows
         has_codeql = False
         has_snyk = False
         has_trivy = False
@@ -742,9 +1666,20 @@ class GitHubFetcher:
         slsa_level = None
 
         if workflows and isinstance(workflows, list):
-            import base64
+            # For more accurate detection, fetch all workflow contents at once
+            # (skip directories)
+            wf_texts = await _gather(
+                *(
+                    self._fetch_text(
+                        f"/repos/{owner}/{repo}/contents/.github/workflows/{wf.get('name')}"
+                    )
+                    if wf.get("type") == "file"
+                    else _value(None)
+                    for wf in workflows
+                )
+            )
 
-            for wf in workflows:
+            for wf, wf_text in zip(workflows, wf_texts, strict=True):
                 name = wf.get("name", "").lower()
 
                 # Check workflow filename
@@ -769,43 +1704,37 @@ class GitHubFetcher:
                 if "sbom" in name or "cyclonedx" in name or "spdx" in name:
                     has_sbom = True
 
-                # For more accurate detection, fetch workflow content (skip directories)
-                if wf.get("type") != "file":
-                    continue
-                wf_content = await self._fetch(f"/repos/{owner}/{repo}/contents/.github/workflows/{wf.get('name')}")
-                if wf_content and isinstance(wf_content, dict) and wf_content.get("content"):
-                    try:
-                        content = base64.b64decode(wf_content["content"]).decode("utf-8").lower()
-                        if "github/codeql-action" in content:
-                            has_codeql = True
-                            has_security_ci = True
-                        if "snyk/actions" in content or "snyk-" in content:
-                            has_snyk = True
-                            has_security_ci = True
-                        if "aquasecurity/trivy" in content or "trivy-action" in content:
-                            has_trivy = True
-                            has_security_ci = True
-                        if "semgrep" in content or "returntocorp/semgrep" in content:
-                            has_semgrep = True
-                            has_security_ci = True
-                        if "sigstore/cosign" in content or "cosign-installer" in content:
-                            has_sigstore = True
-                        if "anchore/sbom-action" in content or "cyclonedx" in content or "spdx" in content:
-                            has_sbom = True
-                        # SLSA detection
-                        if "slsa-framework" in content or "slsa-github-generator" in content:
-                            # Try to detect SLSA level from content
-                            if "slsa-builder-go" in content or "slsa-verifier" in content:
-                                slsa_level = 3
-                            elif "provenance" in content:
-                                slsa_level = 2
-                            else:
-                                slsa_level = 1
-                    except Exception:
-                        pass
+                if wf_text:
+                    # One pass over the content collects every signal present
+                    signals = {m.lastgroup for m in _WORKFLOW_SIGNALS_RE.finditer(wf_text)}
+                    if "codeql" in signals:
+                        has_codeql = True
+                        has_security_ci = True
+                    if "snyk" in signals:
+                        has_snyk = True
+                        has_security_ci = True
+                    if "trivy" in signals:
+                        has_trivy = True
+                        has_security_ci = True
+                    if "semgrep" in signals:
+                        has_semgrep = True
+                        has_security_ci = True
+                    if "sigstore" in signals:
+                        has_sigstore = True
+                    if "sbom" in signals:
+                        has_sbom = True
+                    # SLSA detection
+                    if "slsa" in signals:
+                        # Try to detect SLSA level from content
+                        if "slsa3" in signals:
+                            slsa_level = 3
+                        elif "provenance" in signals:
+                            slsa_level = 2
+                        else:
+                            slsa_level = 1
 
         # Calculate signed commits percentage
-        signed_commits_pct = await self._calculate_signed_commits_pct(owner, repo)
+        signed_commits_pct = await self._calculate_signed_commits_pct(owner, repo, cutoffs)
 
         # Check for reproducible builds (look for specific files/configs)
         has_reproducible_builds = False
@@ -816,8 +1745,8 @@ class GitHubFetcher:
             "Earthfile",  # Earthly
             "nix/",  # Nix builds
         ]
-        root_files = await self._fetch(f"/repos/{owner}/{repo}/contents")
-        if root_files and isinstance(root_files, list):
+        root_files = await self._list_dir(owner, repo)
+        if root_files:
             root_names = {item.get("name", "").lower() for item in root_files}
             if any(f.lower().rstrip("/") in root_names for f in reproducible_files):
                 has_reproducible_builds = True
@@ -839,20 +1768,28 @@ class GitHubFetcher:
             signed_commits_pct=signed_commits_pct,
         )
 
-    async def _calculate_signed_commits_pct(self, owner: str, repo: str) -> float:
+    async def _calculate_signed_commits_pct(
+        self, owner: str, repo: str, cutoffs: _TimeCutoffs | None = None
+    ) -> float:
         """Calculate the percentage of signed commits in recent history.
 
-        Checks the verification status of recent commits.
+        Checks the verification status of the last 100 commits, taken from
+        the past year's commit history when it has that many.
 
         Returns:
             Percentage of signed commits (0.0 to 100.0)
         """
-        # Fetch recent commits with verification info
-        commits = await self._fetch_all_pages(
-            f"/repos/{owner}/{repo}/commits",
-            params={"per_page": 100},
-            max_pages=1,  # Just check last 100 commits
-        )
+        cutoffs = cutoffs or _TimeCutoffs.current()
+        commits = (await self._fetch_commits(owner, repo, cutoffs.since_1y))[:100]
+
+        if len(commits) < 100:
+            # Fewer than 100 commits in a year; the last 100 reach further back
+            commits = await self._fetch_all_pages(
+                f"/repos/{owner}/{repo}/commits",
+                params={"per_page": 100},
+                max_pages=1,  # Just check last 100 commits
+                project=_commit_summary,
+            )
 
         if not commits:
             return 0.0
@@ -860,9 +1797,8 @@ class GitHubFetcher:
         signed_count = 0
         total_count = len(commits)
 
-        for commit in commits:
-            verification = commit.get("commit", {}).get("verification", {})
-            if verification.get("verified", False):
+        for _, _, verified in commits:
+            if verified:
                 signed_count += 1
 
         if total_count == 0:
@@ -874,21 +1810,25 @@ class GitHubFetcher:
         self, owner: str, repo: str, default_branch: str
     ) -> RepoFiles:
         """Check for presence of key repository files."""
-        # Fetch root directory
-        root = await self._fetch(f"/repos/{owner}/{repo}/contents")
-        if not root or not isinstance(root, list):
+        # List root and .github directories (from the cached tree when available)
+        root, github_dir = await _gather(
+            self._list_dir(owner, repo),
+            self._list_dir(owner, repo, ".github"),
+        )
+        if not root:
             return RepoFiles()
 
         root_files = {item.get("name", "").lower(): item for item in root}
+        dir_names = {name for name, item in root_files.items() if item.get("type") == "dir"}
 
         # Check README
-        has_readme = False
-        readme_size = 0
-        for name in ["readme.md", "readme.rst", "readme.txt", "readme"]:
-            if name in root_files:
-                has_readme = True
-                readme_size = root_files[name].get("size", 0)
-                break
+        readme = next(
+            (root_files[name] for name in ("readme.md", "readme.rst", "readme.txt", "readme")
+             if name in root_files),
+            None,
+        )
+        has_readme = readme is not None
+        readme_size = readme.get("size", 0) if readme is not None else 0
 
         # Check other files
         has_license = any(
@@ -904,29 +1844,17 @@ class GitHubFetcher:
         has_governance = "governance.md" in root_files
 
         # Check directories
-        has_docs = any(
-            name in ["docs", "doc", "documentation"] and root_files[name].get("type") == "dir"
-            for name in root_files
-        )
-        has_examples = any(
-            name in ["examples", "example", "samples"]
-            and root_files[name].get("type") == "dir"
-            for name in root_files
-        )
-        has_tests = any(
-            name in ["test", "tests", "__tests__", "spec", "specs"]
-            and root_files[name].get("type") == "dir"
-            for name in root_files
-        )
+        has_docs = not dir_names.isdisjoint(("docs", "doc", "documentation"))
+        has_examples = not dir_names.isdisjoint(("examples", "example", "samples"))
+        has_tests = not dir_names.isdisjoint(("test", "tests", "__tests__", "spec", "specs"))
 
         # Check .github directory for community health files
-        github_dir = await self._fetch(f"/repos/{owner}/{repo}/contents/.github")
         has_ci = False
         has_issue_templates = False
         has_pr_template = False
         has_funding = False
 
-        if github_dir and isinstance(github_dir, list):
+        if github_dir:
             github_files = {item.get("name", "").lower(): item for item in github_dir}
             has_codeowners = "codeowners" in github_files
             has_ci = "workflows" in github_files
@@ -974,8 +1902,6 @@ class GitHubFetcher:
         - Release automation
         - Multi-platform testing (multiple OS)
         """
-        import base64
-
         workflows = await self._fetch(f"/repos/{owner}/{repo}/actions/workflows")
 
         if not workflows or not isinstance(workflows, dict):
@@ -993,41 +1919,54 @@ class GitHubFetcher:
 
         # Analyze each workflow
         for wf in workflow_list:
-            wf_name = wf.get("name", "").lower()
-            wf_path = wf.get("path", "").lower()
+            wf_name = wf.get("name", "")
 
             # Check workflow name patterns
-            if any(p in wf_name for p in ["test", "ci", "build", "check"]):
+            if _TEST_WORKFLOW_RE.search(wf_name):
                 has_tests_workflow = True
-            if any(p in wf_name for p in ["lint", "format", "style", "eslint", "prettier", "ruff", "black"]):
+            if _LINT_WORKFLOW_RE.search(wf_name):
                 has_lint_workflow = True
-            if any(p in wf_name for p in ["security", "codeql", "snyk", "trivy", "scan"]):
+            if _SECURITY_WORKFLOW_RE.search(wf_name):
                 has_security_workflow = True
-            if any(p in wf_name for p in ["release", "publish", "deploy", "npm publish"]):
+            if _RELEASE_WORKFLOW_RE.search(wf_name):
                 has_release_workflow = True
 
+            # Nothing left to detect; skip fetching the remaining workflows
+            if (
+                has_tests_workflow
+                and has_lint_workflow
+                and has_security_workflow
+                and has_release_workflow
+                and has_multi_platform
+            ):
+                break
+
             # Fetch workflow content to detect matrix/multi-platform
-            wf_content_data = await self._fetch(f"/repos/{owner}/{repo}/contents/{wf.get('path')}")
-            if wf_content_data and isinstance(wf_content_data, dict) and wf_content_data.get("content"):
+            wf_text = await self._fetch_text(f"/repos/{owner}/{repo}/contents/{wf.get('path')}")
+            if wf_text:
                 try:
-                    wf_content = base64.b64decode(wf_content_data["content"]).decode("utf-8").lower()
+                    wf_content = wf_text.lower()
 
                     # Detect multi-platform testing
-                    if "matrix:" in wf_content or "strategy:" in wf_content:
-                        if any(os in wf_content for os in ["ubuntu", "windows", "macos"]):
-                            # Check if multiple OS are mentioned
-                            os_count = sum(1 for os in ["ubuntu", "windows", "macos"] if os in wf_content)
-                            if os_count >= 2:
-                                has_multi_platform = True
+                    if not has_multi_platform and (
+                        "matrix:" in wf_content or "strategy:" in wf_content
+                    ):
+                        # Multiple OS mentioned; stop scanning once two are found
+                        has_ubuntu = "ubuntu" in wf_content
+                        has_windows = "windows" in wf_content
+                        if (has_ubuntu and has_windows) or (
+                            (has_ubuntu or has_windows) and "macos" in wf_content
+                        ):
+                            has_multi_platform = True
 
                     # More accurate detection from content
-                    if any(p in wf_content for p in ["pytest", "jest", "npm test", "go test", "cargo test", "unittest"]):
+                    if _TEST_TOOLS_RE.search(wf_content):
                         has_tests_workflow = True
-                    if any(p in wf_content for p in ["eslint", "prettier", "ruff", "black", "flake8", "mypy", "clippy"]):
+                    if _LINT_TOOLS_RE.search(wf_content):
                         has_lint_workflow = True
-                    if any(p in wf_content for p in ["codeql", "snyk", "trivy", "semgrep", "dependabot"]):
+                    if _SECURITY_TOOLS_RE.search(wf_content):
                         has_security_workflow = True
-                    if any(p in wf_content for p in ["npm publish", "twine upload", "cargo publish", "goreleaser"]):
+                    if _RELEASE_TOOLS_RE.search(wf_content):
                         has_release_workflow = True
 
                 except Exception:
@@ -1061,42 +2000,57 @@ class GitHubFetcher:
             has_multi_platform=has_multi_platform,
         )
 
-    async def fetch_readme_content(self, owner: str, repo: str) -> str | None:
-        """Fetch the README content for LLM analysis."""
-        readme = await self._fetch(f"/repos/{owner}/{repo}/readme")
-        if not readme or not isinstance(readme, dict):
-            return None
+    async def fetch_llm_content(
+        self, owner: str, repo: str, github_data: GitHubData
+    ) -> RepoContent:
+        """Fetch everything the LLM assessments read, concurrently.
 
-        # README content is base64 encoded
-        import base64
+        Documents that ``github_data`` shows are absent are not requested.
+        A failed fetch leaves its field empty rather than failing the rest.
+        """
+        fetches = {
+            "issues": self.fetch_recent_issues(owner, repo, limit=15),
+            "maintainer_comments": self.fetch_maintainer_comments(owner, repo, limit=30),
+            "code_samples": self.fetch_source_files_for_security(
+                owner,
+                repo,
+                language=github_data.repo.language,
+                default_branch=github_data.repo.default_branch,
+                max_bytes=15000,
+                max_files=10,
+            ),
+        }
+        files = github_data.files
+        if files.has_readme:
+            fetches["readme"] = self.fetch_readme_content(owner, repo)
+        if files.has_changelog:
+            fetches["changelog"] = self.fetch_changelog_content(owner, repo)
+        if files.has_contributing or files.has_governance:
+            fetches["governance"] = self.fetch_governance_docs(owner, repo)
+
+        content = RepoContent()
+        results = await asyncio.gather(*fetches.values(), return_exceptions=True)
+        for name, result in zip(fetches, results, strict=True):
+            if isinstance(result, Exception):
+                logger.debug(f"Fetching {name} for {owner}/{repo} failed: {result}")
+            elif result:
+                setattr(content, name, result)
+        return content
 
-        content = readme.get("content", "")
-        if content:
-            try:
-                return base64.b64decode(content).decode("utf-8")
-            except Exception:
-                return None
-        return None
+    async def fetch_readme_content(self, owner: str, repo: str) -> str | None:
+        """Fetch the README content for LLM analysis."""
+        return await self._fetch_text(f"/repos/{owner}/{repo}/readme")
 
     async def fetch_security_md_content(self, owner: str, repo: str) -> str | None:
         """Fetch SECURITY.md content for LLM analysis."""
-        security = await self._fetch(f"/repos/{owner}/{repo}/contents/SECURITY.md")
-        if not security or not isinstance(security, dict):
+        if not await self._existing_paths(owner, repo, ["SECURITY.md"]):
             return None
 
-        import base64
-
-        content = security.get("content", "")
-        if content:
-            try:
-                return base64.b64decode(content).decode("utf-8")
-            except Exception:
-                return None
-        return None
+        return await self._fetch_text(f"/repos/{owner}/{repo}/contents/SECURITY.md")
 
     async def fetch_recent_issues(
         self, owner: str, repo: str, limit: int = 20
-    ) -> list[dict]:
+    ) -> list[IssueRecord]:
         """Fetch recent issues with comments for sentiment analysis."""
         issues = await self._fetch_all_pages(
             f"/repos/{owner}/{repo}/issues",
@@ -1108,46 +2062,36 @@ class GitHubFetcher:
         issues = [i for i in issues if "pull_request" not in i][:limit]
 
         # Simplify for LLM consumption
-        result = []
-        for issue in issues:
-            result.append({
-                "title": issue.get("title"),
-                "state": issue.get("state"),
-                "created_at": issue.get("created_at"),
-                "comments": issue.get("comments", 0),
-                "labels": [l.get("name") for l in issue.get("labels", [])],
-                "body": (issue.get("body") or "")[:500],  # Truncate long bodies
-            })
-
-        return result
+        return [
+            IssueRecord(
+                title=issue.get("title"),
+                state=issue.get("state"),
+                created_at=issue.get("created_at"),
+                comments=issue.get("comments", 0),
+                labels=tuple(l.get("name") for l in issue.get("labels", [])),
+                body=(issue.get("body") or "")[:500],  # Truncate long bodies
+            )
+            for issue in issues
+        ]
 
     async def fetch_changelog_content(self, owner: str, repo: str) -> str | None:
         """Fetch CHANGELOG content for LLM analysis.
 
-        Tries multiple common changelog filenames.
+        Tries multiple common changelog filenames, skipping those that the
+        repository tree shows don't exist. Remaining candidates are fetched
+        concurrently and the first one in priority order wins.
         """
-        import base64
-
-        # Try common changelog names
-        changelog_names = [
-            "CHANGELOG.md",
-            "CHANGELOG",
-            "CHANGELOG.txt",
-            "CHANGES.md",
-            "CHANGES",
-            "HISTORY.md",
-            "HISTORY",
-            "NEWS.md",
-            "NEWS",
-        ]
+        changelog_names = await self._existing_paths(owner, repo, self.CHANGELOG_NAMES)
 
-        for name in changelog_names:
-            content_data = await self._fetch(f"/repos/{owner}/{repo}/contents/{name}")
-            if content_data and isinstance(content_data, dict) and content_data.get("content"):
-                try:
-                    return base64.b64decode(content_data["content"]).decode("utf-8")
-                except Exception:
-                    continue
+        # A failed file is skipped like a missing one
+        results = await asyncio.gather(
+            *(self._fetch_text(f"/repos/{owner}/{repo}/contents/{n}") for n in changelog_names),
+            return_exceptions=True,
+        )
+
+        for content in results:
+            if content and isinstance(content, str):
+                return content
 
         return None
 
@@ -1156,27 +2100,19 @@ class GitHubFetcher:
 
         Combines GOVERNANCE.md, CONTRIBUTING.md, and related docs.
         """
-        import base64
-
         docs = []
 
-        # Files to check
-        gov_files = [
-            "GOVERNANCE.md",
-            "CONTRIBUTING.md",
-            "MAINTAINERS.md",
-            "MAINTAINERS",
-            ".github/CONTRIBUTING.md",
-        ]
+        gov_files = await self._existing_paths(owner, repo, self.GOVERNANCE_FILES)
 
-        for filename in gov_files:
-            content_data = await self._fetch(f"/repos/{owner}/{repo}/contents/{filename}")
-            if content_data and isinstance(content_data, dict) and content_data.get("content"):
-                try:
-                    content = base64.b64decode(content_data["content"]).decode("utf-8")
-                    docs.append(f"# {filename}\n\n{content}")
-                except Exception:
-                    continue
+        # Fetch all files concurrently; a failed file is skipped like a missing one
+        results = await asyncio.gather(
+            *(self._fetch_text(f"/repos/{owner}/{repo}/contents/{f}") for f in gov_files),
+            return_exceptions=True,
+        )
+
+        for filename, content in zip(gov_files, results, strict=True):
+            if content and isinstance(content, str):
+                docs.append(f"# {filename}\n\n{content}")
 
         return "\n\n---\n\n".join(docs) if docs else None
 
@@ -1187,39 +2123,39 @@ class GitHubFetcher:
 
         Returns a list of comment texts from maintainers.
         """
-        # First get list of contributors to identify maintainers
-        contributors = await self._fetch_all_pages(
-            f"/repos/{owner}/{repo}/contributors",
-            max_pages=1,
+        # The top contributors identify the maintainers (the list is usually
+        # already loaded by the contributor stats); the recent issue comments
+        # don't depend on it, so fetch both at once
+        contributors, comments = await _gather(
+            self._fetch_contributors(owner, repo),
+            self._fetch_all_pages(
+                f"/repos/{owner}/{repo}/issues/comments",
+                params={"sort": "updated", "direction": "desc", "per_page": 100},
+                max_pages=2,
+            ),
         )
 
         # Consider top contributors as maintainers (top 5 or those with significant contributions)
-        maintainer_logins = set()
-        if contributors:
-            total_contributions = sum(c.get("contributions", 0) for c in contributors[:10])
-            threshold = total_contributions * 0.05 if total_contributions > 0 else 1
-            for c in contributors[:10]:
-                if c.get("contributions", 0) >= threshold:
-                    maintainer_logins.add(c.get("login", "").lower())
-
-        # Also add repo owner
-        maintainer_logins.add(owner.lower())
-
-        if not maintainer_logins:
-            return []
-
-        # Fetch recent issue comments
-        comments = await self._fetch_all_pages(
-            f"/repos/{owner}/{repo}/issues/comments",
-            params={"sort": "updated", "direction": "desc", "per_page": 100},
-            max_pages=2,
-        )
-
-        # Filter to maintainer comments
+        top = contributors[:10]
+        total_contributions = sum(c.get("contributions", 0) for c in top)
+        threshold = total_contributions * 0.05 if total_contributions > 0 else 1
+        maintainer_logins = frozenset(
+            (c.get("login") or "").lower()
+            for c in top
+            if c.get("contributions", 0) >= threshold
+        ) | {owner.lower()}  # Also add repo owner
+
+        # Filter to maintainer comments. The same few authors repeat across
+        # comments, so remember each login's verdict instead of lowercasing it
+        # on every comment.
+        is_maintainer: dict[str, bool] = {}
         maintainer_comments = []
         for comment in comments:
-            author = comment.get("user", {}).get("login", "").lower()
-            if author in maintainer_logins:
+            login = (comment.get("user") or {}).get("login") or ""
+            verdict = is_maintainer.get(login)
+            if verdict is None:
+                verdict = is_maintainer[login] = login.lower() in maintainer_logins
+            if verdict:
                 body = comment.get("body", "")
                 if body and len(body) > 20:  # Skip very short comments
                     maintainer_comments.append(body[:1000])  # Truncate long comments
@@ -1263,6 +2199,22 @@ class GitHubFetcher:
         "http", "client", "connection", "socket",
     ]
 
+    # Don't fetch another file for a sample budget smaller than this
+    MIN_SAMPLE_BYTES = 500
+
+    # Zero-width lookahead so every occurrence is found, even overlapping ones
+    _PRIORITY_RE = re.compile(
+        "(?=(" + "|".join(map(re.escape, SECURITY_PRIORITY_PATTERNS)) + "))"
+    )
+    # Earlier patterns rank higher
+    _PRIORITY_RANK = dict(
+        zip(
+            SECURITY_PRIORITY_PATTERNS,
+            range(len(SECURITY_PRIORITY_PATTERNS), 0, -1),
+            strict=True,
+        )
+    )
+
     async def fetch_source_files_for_security(
         self,
         owner: str,
@@ -1288,8 +2240,6 @@ class GitHubFetcher:
         Returns:
             Combined source code with file headers, or None if no files found.
         """
-        import base64
-
         if not language:
             return None
 
@@ -1311,93 +2261,108 @@ class GitHubFetcher:
             else:
                 return None
 
-        # Fetch the repository tree
-        tree_data = await self._fetch(
-            f"/repos/{owner}/{repo}/git/trees/{default_branch}",
-            params={"recursive": "1"},
-        )
+        # Fetch the repository tree (shared with the other file lookups)
+        tree = await self._fetch_tree(owner, repo, default_branch)
 
-        if not tree_data or "tree" not in tree_data:
+        if tree is None:
             return None
+        if tree.truncated:
+            # Still usable; the sample just comes from the part GitHub returned
+            logger.debug(f"Tree for {owner}/{repo} is truncated; sampling a partial listing")
 
         # Filter to source files with matching extensions
-        source_files = []
-        for item in tree_data["tree"]:
-            if item.get("type") != "blob":
-                continue
+        extensions = tuple(extensions)
 
-            path = item.get("path", "")
-            size = item.get("size", 0)
+        def matching_files():
+            for item in tree.entries.values():
+                if item.get("type") != "blob":
+                    continue
 
-            # Skip very large files
-            if size > 50000:
-                continue
+                # Cheapest checks first: most blobs fail the extension test
+                path = item.get("path", "")
+                if not path.endswith(extensions):
+                    continue
 
-            # Check extension
-            if not any(path.endswith(ext) for ext in extensions):
-                continue
+                # Skip empty and very large files
+                size = item.get("size", 0)
+                if size == 0 or size > 50000:
+                    continue
 
-            # Skip test files, vendor, node_modules, etc.
-            path_lower = path.lower()
-            skip_patterns = [
-                "test", "spec", "mock", "fixture", "vendor", "node_modules",
-                "dist", "build", "__pycache__", ".min.", "example", "sample",
-                "benchmark", "doc/", "docs/",
-            ]
-            if any(pattern in path_lower for pattern in skip_patterns):
-                continue
+                # Skip test files, vendor, node_modules, etc.
+                path_lower = path.lower()
+                if _SKIP_SOURCE_PATH_RE.search(path_lower):
+                    continue
 
-            # Calculate priority score based on security-relevant patterns
-            priority = 0
-            filename_lower = path.split("/")[-1].lower()
-            for i, pattern in enumerate(self.SECURITY_PRIORITY_PATTERNS):
-                if pattern in filename_lower or pattern in path_lower:
-                    priority = len(self.SECURITY_PRIORITY_PATTERNS) - i
-                    break
+                # Calculate priority score from the highest-ranked security-relevant
+                # pattern in the path (the filename is part of it)
+                priority = max(
+                    (
+                        self._PRIORITY_RANK[m.group(1)]
+                        for m in self._PRIORITY_RE.finditer(path_lower)
+                    ),
+                    default=0,
+                )
 
-            source_files.append({
-                "path": path,
-                "sha": item.get("sha"),
-                "size": size,
-                "priority": priority,
-            })
+                yield {
+                    "path": path,
+                    "sha": item.get("sha"),
+                    "size": size,
+                    "priority": priority,
+                }
+
+        # Keep only the best candidates by priority (highest first), then by
+        # path depth (shallower first); a few spares cover files that turn out
+        # not to be text. Huge trees never get materialized as one sorted list.
+        source_files = heapq.nsmallest(
+            max_files * 3,
+            matching_files(),
+            key=lambda f: (-f["priority"], f["path"].count("/")),
+        )
 
         if not source_files:
             return None
 
-        # Sort by priority (highest first), then by path depth (shallower first)
-        source_files.sort(key=lambda f: (-f["priority"], f["path"].count("/")))
-
-        # Fetch file contents up to limits
+        # Fetch file contents up to limits. Once the remaining budget is too
+        # small to show anything useful, stop rather than fetch a whole blob
+        # for a sliver of it.
         fetched_content = []
         total_bytes = 0
-
-        for file_info in source_files:
-            if len(fetched_content) >= max_files:
-                break
-            if total_bytes >= max_bytes:
+        candidates = iter(source_files)
+        stop_at = max_bytes - min(self.MIN_SAMPLE_BYTES, max_bytes)
+
+        while len(fetched_content) < max_files and total_bytes <= stop_at:
+            # Plan the next batch from the sizes in the tree so the blobs can
+            # be fetched concurrently; another batch is only needed when some
+            # files turn out not to be text
+            batch = []
+            planned_bytes = total_bytes
+            while len(fetched_content) + len(batch) < max_files and planned_bytes <= stop_at:
+                file_info = next(candidates, None)
+                if file_info is None:
+                    break
+                batch.append(file_info)
+                planned_bytes += file_info["size"]
+            if not batch:
                 break
 
-            # Fetch file content
-            blob_data = await self._fetch(
-                f"/repos/{owner}/{repo}/git/blobs/{file_info['sha']}"
+            texts = await self._fetch_blob_texts(
+                owner, repo, [file_info["sha"] for file_info in batch]
             )
 
-            if not blob_data or "content" not in blob_data:
-                continue
+            for file_info, content in zip(batch, texts, strict=True):
+                if total_bytes > stop_at:
+                    break
 
-            try:
-                content = base64.b64decode(blob_data["content"]).decode("utf-8")
-            except Exception:
-                continue
+                if content is None:
+                    continue
 
-            # Truncate if needed to stay within limits
-            remaining_bytes = max_bytes - total_bytes
-            if len(content) > remaining_bytes:
-                content = content[:remaining_bytes] + "\n... (truncated)"
+                # Truncate if needed to stay within limits
+                remaining_bytes = max_bytes - total_bytes
+                if len(content) > remaining_bytes:
+                    content = content[:remaining_bytes] + "\n... (truncated)"
 
-            fetched_content.append(f"=== FILE: {file_info['path']} ===\n{content}")
-            total_bytes += len(content)
+                fetched_content.append(f"=== FILE: {file_info['path']} ===\n{content}")
+                total_bytes += len(content)
 
         if not fetched_content:
             return None
@@ -1,11 +1,15 @@
 """LLM-based analysis using Ollama."""
 
+import asyncio
 import json
 import re
+from collections.abc import Iterable
+from dataclasses import asdict, is_dataclass
 from typing import Any
 
 import httpx
 
+from pkgrisk.analyzers.cache import ResponseCache
 from pkgrisk.models.schemas import (
     ChangelogAssessment,
     CommunicationAssessment,
@@ -16,6 +20,158 @@ from pkgrisk.models.schemas import (
     SentimentAssessment,
 )
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+def _dumps_indented(obj: Any) -> str:
+    """Serialize to 2-space indented JSON, with orjson when it's installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    # orjson writes non-ASCII as-is; match it so prompts don't depend on the backend
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _budgeted_join(items: Iterable[str], budget: int, sep: str) -> str:
+    """Join whole items until the next one would take the result past budget.
+
+    Items are consumed lazily, so nothing past the budget is built. A first
+    item that alone exceeds the budget is cut to fit.
+    """
+    parts: list[str] = []
+    used = 0
+    for item in items:
+        cost = len(item) + (len(sep) if parts else 0)
+        if used + cost > budget:
+            if not parts:
+                parts.append(item[:budget])
+            break
+        parts.append(item)
+        used += cost
+    return sep.join(parts)
+
+
+# Parse JSON with orjson when it's installed
+_loads = orjson.loads if orjson is not None else json.loads
+
+_THINK_RE = re.compile(r"<think>.*?</think>", re.DOTALL)
+
+# Braces, and whole string literals so braces inside strings are skipped
+_JSON_TOKEN_RE = re.compile(r'"(?:[^"\\]|\\.)*"|[{}]', re.DOTALL)
+
+
+def _find_object_end(text: str, start: int) -> int | None:
+    """Return the index just past the brace that closes the one at text[start].
+
+    Returns None if the object is never closed (e.g. a truncated reply).
+    """
+    depth = 0
+    for match in _JSON_TOKEN_RE.finditer(text, start):
+        token = match.group()
+        if token == "{":
+            depth += 1
+        elif token == "}":
+            depth -= 1
+            if depth == 0:
+                return match.end()
+    return None
+
+
+# What the stream scanner looks for, by state: outside any object, inside an
+# object, inside a string literal, and inside a <think> block
+_SCAN_OUTSIDE_RE = re.compile(r"<think>|\{")
+_SCAN_OBJECT_RE = re.compile(r'<think>|[{}"]')
+_SCAN_STRING_RE = re.compile(r'\\.|"', re.DOTALL)
+_SCAN_THINK_RE = re.compile(r"</think>")
+
+
+def _partial_suffix(text: str, token: str) -> str:
+    """Return the longest end of text that could be the start of token."""
+    for size in range(min(len(token) - 1, len(text)), 0, -1):
+        if token.startswith(text[-size:]):
+            return text[-size:]
+    return ""
+
+
+class _JSONStreamScanner:
+    """Watches a streamed reply for the first complete JSON object.
+
+    Does the same balanced-brace scan as _extract_json, but keeps its state
+    between chunks so each character is only looked at once.
+    """
+
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+        self._length = 0
+        # Unscanned end of the last chunk that may be half of a token
+        self._carry = ""
+        self._depth = 0
+        self._start = 0  # Offset of the brace opening the current object
+        self._in_string = False
+        self._in_think = False
+
+    @property
+    def text(self) -> str:
+        """The reply received so far."""
+        return "".join(self._parts)
+
+    def feed(self, piece: str) -> bool:
+        """Add a chunk of the reply; return True once it holds a parseable object."""
+        offset = self._length - len(self._carry)
+        self._parts.append(piece)
+        self._length += len(piece)
+        chunk = self._carry + piece
+        pos = 0
+        while True:
+            if self._in_think:
+                pattern = _SCAN_THINK_RE
+            elif self._in_string:
+                pattern = _SCAN_STRING_RE
+            else:
+                pattern = _SCAN_OBJECT_RE if self._depth else _SCAN_OUTSIDE_RE
+            match = pattern.search(chunk, pos)
+            if match is None:
+                break
+            pos = match.end()
+            token = match.group()
+            if self._in_think:
+                self._in_think = False
+            elif self._in_string:
+                self._in_string = token != '"'
+            elif token == "<think>":
+                self._in_think = True
+            elif token == '"':
+                self._in_string = True
+            elif token == "{":
+                if not self._depth:
+                    self._start = offset + match.start()
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if not self._depth and self._parses(offset + pos):
+                    return True
+
+        rest = chunk[pos:]
+        if self._in_think:
+            self._carry = _partial_suffix(rest, "</think>")
+        elif self._in_string:
+            self._carry = "\\" if rest.endswith("\\") else ""
+        else:
+            self._carry = _partial_suffix(rest, "<think>")
+        return False
+
+    def _parses(self, end: int) -> bool:
+        """Check whether the object that just closed is valid JSON."""
+        text = self.text
+        self._parts = [text]
+        try:
+            _loads(_THINK_RE.sub("", text[self._start:end]))
+        except ValueError:
+            return False
+        return True
+
 
 class LLMAnalyzer:
     """Runs LLM-based analysis using Ollama.
@@ -30,11 +186,23 @@ class LLMAnalyzer:
     DEFAULT_MODEL = "llama3.3:70b"
     DEFAULT_FAST_MODEL = "qwen2.5:7b-instruct"
 
+    # Context window requested for every call. Fixed so Ollama never reloads
+    # a model just because the size changed; large enough for the longest
+    # prompt (10k characters of code plus instructions) and the reply.
+    NUM_CTX = 8192
+
+    # Keep models loaded between packages instead of Ollama's 5 minute default
+    KEEP_ALIVE = "30m"
+
+    # How long a cached reply is reused before the prompt is sent again
+    CACHE_TTL = 7 * 24 * 60 * 60
+
     def __init__(
         self,
         model: str = DEFAULT_MODEL,
         fast_model: str | None = DEFAULT_FAST_MODEL,
         client: httpx.AsyncClient | None = None,
+        cache: ResponseCache | None = None,
     ) -> None:
         """Initialize the analyzer.
 
@@ -42,19 +210,42 @@ class LLMAnalyzer:
             model: Primary model for complex analysis (README, security).
             fast_model: Faster model for simpler tasks (sentiment, maintenance, etc.).
                        Set to None to use primary model for all tasks.
-            client: Optional httpx client.
+            client: Optional httpx client. If not provided, one is created on first
+                use and reused until aclose().
+            cache: Optional on-disk cache of replies keyed by the exact request,
+                so re-analyzing an unchanged package skips the LLM.
         """
         self.model = model
         # If fast_model is None, fall back to main model
         self.fast_model = fast_model if fast_model is not None else model
         self._client = client
+        self._owned_client: httpx.AsyncClient | None = None
+        self._cache = cache
         self._fast_model_verified = False
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create an HTTP client."""
+        """Get the injected HTTP client, or the one owned by this analyzer."""
         if self._client is not None:
             return self._client
-        return httpx.AsyncClient(timeout=300.0)  # LLM can be slow
+        if self._owned_client is None or self._owned_client.is_closed:
+            self._owned_client = httpx.AsyncClient(
+                # LLM can be slow, but a dead Ollama should fail fast
+                timeout=httpx.Timeout(300.0, connect=10.0),
+                limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+            )
+        return self._owned_client
+
+    async def aclose(self) -> None:
+        """Close the HTTP client, if this analyzer created one."""
+        if self._owned_client is not None:
+            await self._owned_client.aclose()
+            self._owned_client = None
+
+    async def __aenter__(self) -> "LLMAnalyzer":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
 
     async def _verify_fast_model(self) -> None:
         """Verify fast_model is available, fall back to main model if not."""
@@ -77,8 +268,6 @@ class LLMAnalyzer:
             self.fast_model = self.model
         finally:
             self._fast_model_verified = True
-            if self._client is None:
-                await client.aclose()
 
     async def _generate(
         self,
@@ -102,29 +291,53 @@ class LLMAnalyzer:
             model = self.fast_model  # May have been updated to main model
 
         model = model or self.model
-        client = await self._get_client()
 
         payload: dict[str, Any] = {
             "model": model,
             "prompt": prompt,
-            "stream": False,
+            "stream": True,
+            "keep_alive": self.KEEP_ALIVE,
             "options": {
                 "temperature": 0.1,  # Low temperature for consistent scoring
+                "num_ctx": self.NUM_CTX,
             },
         }
         if system:
             payload["system"] = system
 
-        try:
-            response = await client.post(
-                f"{self.OLLAMA_URL}/api/generate",
-                json=payload,
-            )
+        cache = self._cache
+        key = ResponseCache.make_key("POST", "/api/generate", payload)
+        if cache is not None:
+            cached = cache.get(key)
+            if cached is not None and cached.age() < self.CACHE_TTL:
+                return cached.body.decode("utf-8")
+
+        client = await self._get_client()
+        scanner = _JSONStreamScanner()
+        complete = False
+        # Stream the reply and hang up once it holds a usable JSON object, so
+        # Ollama stops decoding whatever commentary the model adds after it
+        async with client.stream(
+            "POST", f"{self.OLLAMA_URL}/api/generate", json=payload
+        ) as response:
             response.raise_for_status()
-            return response.json().get("response", "")
-        finally:
-            if self._client is None:
-                await client.aclose()
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                chunk = _loads(line)
+                if "error" in chunk:
+                    raise ValueError(f"Ollama error: {chunk['error']}")
+                if scanner.feed(chunk.get("response", "")):
+                    complete = True
+                    break
+                if chunk.get("done"):
+                    break
+        text = scanner.text
+
+        # Don't pin a malformed reply; let the next run ask again
+        if cache is not None and complete:
+            cache.set(key, text.encode("utf-8"))
+        return text
 
     def _extract_json(self, text: str) -> dict:
         """Extract JSON from LLM response text.
@@ -140,22 +353,26 @@ class LLMAnalyzer:
         """
         # Remove thinking tags (e.g., from deepseek-r1)
         # <think>...</think> blocks should be stripped
-        text = re.sub(r"<think>.*?</think>", "", text, flags=re.DOTALL)
-
-        # Try to find JSON block in code fence
-        json_match = re.search(r"```(?:json)?\s*\n?(.*?)\n?```", text, re.DOTALL)
-        if json_match:
-            text = json_match.group(1)
-
-        # Try to find bare JSON object
-        obj_match = re.search(r"\{.*\}", text, re.DOTALL)
-        if obj_match:
-            text = obj_match.group(0)
-
-        try:
-            return json.loads(text)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Could not extract JSON from response: {e}") from e
+        if "<think>" in text:
+            text = _THINK_RE.sub("", text)
+
+        # Take the first balanced {...} that parses. This also finds objects
+        # inside ```json fences and ignores any prose after the object.
+        error: ValueError | None = None
+        pos = text.find("{")
+        while pos != -1:
+            end = _find_object_end(text, pos)
+            if end is None:
+                break
+            try:
+                return _loads(text[pos:end])
+            except ValueError as e:
+                error = e
+            pos = text.find("{", end)
+
+        raise ValueError(
+            f"Could not extract JSON from response: {error or 'no complete JSON object'}"
+        )
 
     async def assess_readme(
         self,
@@ -270,27 +487,32 @@ Respond in JSON only:
 
     async def assess_sentiment(
         self,
-        issues: list[dict],
+        issues: list[Any],
         package_name: str,
         ecosystem: str,
     ) -> SentimentAssessment:
         """Assess sentiment from GitHub issues.
 
         Args:
-            issues: List of issue dicts with title, body, comments, etc.
+            issues: List of issue records (or dicts) with title, body, comments, etc.
             package_name: Name of the package.
             ecosystem: Package ecosystem.
 
         Returns:
             SentimentAssessment with community health indicators.
         """
-        issues_json = json.dumps(issues[:20], indent=2)
+        # Whole issues only, serialized until the prompt budget is reached
+        issues_json = "[\n" + _budgeted_join(
+            (_dumps_indented(asdict(i) if is_dataclass(i) else i) for i in issues[:20]),
+            8000,
+            ",\n",
+        ) + "\n]"
 
         prompt = f"""Analyze these recent GitHub issues for a software project. Assess overall community health.
 
 Package: {package_name} ({ecosystem})
 Issues:
-{issues_json[:8000]}
+{issues_json}
 
 Respond in JSON only:
 {{
@@ -333,13 +555,13 @@ Respond in JSON only:
         Returns:
             CommunicationAssessment with quality indicators.
         """
-        comments_text = "\n---\n".join(comments[:30])
+        comments_text = _budgeted_join(comments[:30], 8000, "\n---\n")
 
         prompt = f"""Analyze these maintainer responses in GitHub issues and pull requests.
 
 Package: {package_name} ({ecosystem})
 Maintainer comments:
-{comments_text[:8000]}
+{comments_text}
 
 Assess:
 1. HELPFULNESS: Do responses actually help resolve issues?
@@ -525,6 +747,67 @@ Respond in JSON only:
             summary=data.get("summary", ""),
         )
 
+    async def assess_all_fast(
+        self,
+        package_name: str,
+        ecosystem: str,
+        issues: list[Any] | None = None,
+        comments: list[str] | None = None,
+        maintenance: dict[str, Any] | None = None,
+        changelog_content: str | None = None,
+        governance_docs: str | None = None,
+    ) -> dict[str, Any]:
+        """Run every fast-model assessment that has input, concurrently.
+
+        The requests are submitted together so Ollama can work through them
+        back-to-back on the already loaded fast model instead of idling while
+        each response is parsed.
+
+        Args:
+            package_name: Name of the package.
+            ecosystem: Package ecosystem.
+            issues: Issue records for the sentiment assessment.
+            comments: Maintainer comments for the communication assessment.
+            maintenance: Keyword arguments for assess_maintenance, minus
+                package_name and ecosystem.
+            changelog_content: The CHANGELOG file content.
+            governance_docs: Combined governance documentation.
+
+        Returns:
+            Completed assessments keyed by LLMAssessments field name. Assessments
+            that had no input or failed are left out.
+        """
+        tasks: dict[str, Any] = {}
+        if issues:
+            tasks["sentiment"] = self.assess_sentiment(issues, package_name, ecosystem)
+        if comments:
+            tasks["communication"] = self.assess_communication(
+                comments, package_name, ecosystem
+            )
+        if maintenance is not None:
+            tasks["maintenance"] = self.assess_maintenance(
+                **maintenance, package_name=package_name, ecosystem=ecosystem
+            )
+        if changelog_content:
+            tasks["changelog"] = self.assess_changelog(
+                changelog_content, package_name, ecosystem
+            )
+        if governance_docs:
+            tasks["governance"] = self.assess_governance(
+                governance_docs, package_name, ecosystem
+            )
+        if not tasks:
+            return {}
+
+        # Settle the fast-model check once rather than in every request
+        await self._verify_fast_model()
+        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        return {
+            key: result
+            for key, result in zip(tasks, results, strict=True)
+            if not isinstance(result, Exception)
+        }
+
     async def is_available(self) -> bool:
         """Check if Ollama is running and the model is available."""
         client = await self._get_client()
@@ -540,6 +823,3 @@ Respond in JSON only:
             )
         except Exception:
             return False
-        finally:
-            if self._client is None:
-                await client.aclose()
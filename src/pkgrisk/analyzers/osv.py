@@ -1,11 +1,90 @@
 """OSV (Open Source Vulnerabilities) fetcher for CVE data."""
 
+import asyncio
+import importlib.util
+import json
+import logging
+import math
+import re
 from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any
 
 import httpx
 
+from pkgrisk.analyzers.cache import ResponseCache
 from pkgrisk.models.schemas import CVEDetail, CVEHistory, ReleaseStats
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Decode JSON bodies with orjson when it's installed
+_loads = orjson.loads if orjson is not None else json.loads
+
+# OSV timestamps end in "Z", which fromisoformat accepts natively on 3.11+
+_parse_datetime = datetime.fromisoformat
+
+# Metric:value pairs of a CVSS vector ("AV:N", "PR:L", ...)
+_CVSS_METRIC_RE = re.compile(r"([A-Z]+):([A-Z])")
+
+# CVSS v3.1 base metric weights
+_CVSS3_WEIGHTS: dict[str, dict[str, float]] = {
+    "AV": {"N": 0.85, "A": 0.62, "L": 0.55, "P": 0.2},
+    "AC": {"L": 0.77, "H": 0.44},
+    "UI": {"N": 0.85, "R": 0.62},
+    "C": {"H": 0.56, "L": 0.22, "N": 0.0},
+    "I": {"H": 0.56, "L": 0.22, "N": 0.0},
+    "A": {"H": 0.56, "L": 0.22, "N": 0.0},
+}
+# Privileges Required weighs more when the scope changes
+_CVSS3_PR_WEIGHTS: dict[str, dict[str, float]] = {
+    "U": {"N": 0.85, "L": 0.62, "H": 0.27},
+    "C": {"N": 0.85, "L": 0.68, "H": 0.5},
+}
+
+
+def _cvss3_roundup(value: float) -> float:
+    """Round up to one decimal as specified by CVSS v3.1 (avoids float artifacts)."""
+    scaled = round(value * 100_000)
+    if scaled % 10_000 == 0:
+        return scaled / 100_000
+    return (math.floor(scaled / 10_000) + 1) / 10
+
+
+@lru_cache(maxsize=1024)
+def _cvss3_base_score(vector: str) -> float | None:
+    """Calculate the base score of a CVSS v3.x vector string.
+
+    Returns None if the vector is missing a base metric or has an unknown value.
+    """
+    metrics = dict(_CVSS_METRIC_RE.findall(vector))
+    scope = metrics.get("S")
+    if scope not in _CVSS3_PR_WEIGHTS:
+        return None
+    try:
+        av, ac, ui, c, i, a = (
+            _CVSS3_WEIGHTS[m][metrics[m]] for m in ("AV", "AC", "UI", "C", "I", "A")
+        )
+        pr = _CVSS3_PR_WEIGHTS[scope][metrics["PR"]]
+    except KeyError:
+        return None
+
+    iss = 1 - (1 - c) * (1 - i) * (1 - a)
+    impact = (
+        6.42 * iss if scope == "U" else 7.52 * (iss - 0.029) - 3.25 * (iss - 0.02) ** 15
+    )
+    if impact <= 0:
+        return 0.0
+
+    exploitability = 8.22 * av * ac * pr * ui
+    if scope == "U":
+        return _cvss3_roundup(min(impact + exploitability, 10))
+    return _cvss3_roundup(min(1.08 * (impact + exploitability), 10))
+
 
 class OSVFetcher:
     """Fetches vulnerability data from OSV (Open Source Vulnerabilities) database.
@@ -26,42 +105,165 @@ class OSVFetcher:
         "homebrew": None,  # Query by GitHub repo instead
     }
 
-    def __init__(self, client: httpx.AsyncClient | None = None) -> None:
+    # Sort order of severities, most severe first
+    SEVERITY_RANK = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3, "UNKNOWN": 4}
+
+    # Most queries OSV accepts in one querybatch request
+    BATCH_SIZE = 1000
+
+    # Requests in flight at once across all lookups of this fetcher
+    MAX_CONCURRENT_REQUESTS = 16
+
+    # Retries for rate limiting and transient server errors, with exponential
+    # backoff starting at RETRY_BASE_DELAY seconds (or OSV's Retry-After)
+    MAX_RETRIES = 3
+    RETRY_BASE_DELAY = 1.0
+    MAX_RETRY_DELAY = 30.0
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+    # Advisories change over hours to days, so cached replies are reused this long
+    CACHE_TTL = 6 * 60 * 60
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient | None = None,
+        cache: ResponseCache | None = None,
+        cache_ttl: float = CACHE_TTL,
+        max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS,
+    ) -> None:
         """Initialize the fetcher.
 
         Args:
-            client: Optional httpx client. If not provided, creates one per request.
+            client: Optional httpx client. If not provided, a pooled client is created
+                on first use and reused until aclose().
+            cache: Optional on-disk response cache.
+            cache_ttl: Seconds a cached response is served without asking OSV again.
+            max_concurrent_requests: Most OSV requests in flight at once.
         """
         self._client = client
+        self._owned_client: httpx.AsyncClient | None = None
+        self._cache = cache
+        self.cache_ttl = cache_ttl
+        self._semaphore = asyncio.Semaphore(max_concurrent_requests)
+        # Records looked up ahead of time by prefetch(), keyed by query
+        self._prefetched: dict[str, list[dict]] = {}
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create an HTTP client."""
+        """Get the injected HTTP client, or the pooled one owned by this fetcher."""
         if self._client is not None:
             return self._client
-        return httpx.AsyncClient(timeout=30.0)
+        if self._owned_client is None or self._owned_client.is_closed:
+            self._owned_client = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                # Multiplex requests over one connection when h2 is installed
+                http2=importlib.util.find_spec("h2") is not None,
+            )
+        return self._owned_client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client, if this fetcher created one."""
+        if self._owned_client is not None:
+            await self._owned_client.aclose()
+            self._owned_client = None
+
+    async def __aenter__(self) -> "OSVFetcher":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float | None:
+        """Return how long to wait before retrying, or None if it shouldn't be retried."""
+        if response.status_code not in self.RETRY_STATUSES:
+            return None
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), self.MAX_RETRY_DELAY)
+            except ValueError:
+                pass
+        return min(self.RETRY_BASE_DELAY * 2**attempt, self.MAX_RETRY_DELAY)
+
+    async def _send(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request, bounded by the concurrency limit.
+
+        Retries with backoff on 429s, 5xx errors and connection errors; the
+        last response is returned as-is.
+        """
+        client = await self._get_client()
+        attempt = 0
+        while True:
+            try:
+                async with self._semaphore:
+                    response = await client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                if attempt >= self.MAX_RETRIES:
+                    raise
+                delay = min(self.RETRY_BASE_DELAY * 2**attempt, self.MAX_RETRY_DELAY)
+                reason = repr(e)
+            else:
+                delay = self._retry_delay(response, attempt)
+                if delay is None or attempt >= self.MAX_RETRIES:
+                    return response
+                reason = str(response.status_code)
+
+            logger.debug(f"OSV request failed ({reason}), retrying in {delay:.0f}s: {url}")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _request_json(
+        self, method: str, path: str, body: dict | None = None
+    ) -> dict:
+        """Send a request to the OSV API and decode the JSON reply (cached).
+
+        Raises:
+            httpx.HTTPStatusError: If OSV still answers with an error after
+                retrying. A failed lookup must not read as "no vulnerabilities".
+        """
+        # Point-in-time queries by commit aren't worth keeping
+        cache = self._cache if "commit" not in (body or {}) else None
+        key = ResponseCache.make_key(method, path, body)
+        cached = None
+        headers = {}
+        if cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                if cached.age() < self.cache_ttl:
+                    return _loads(cached.body)
+                # Stale: revalidate rather than download the body again
+                if cached.etag:
+                    headers["If-None-Match"] = cached.etag
+
+        response = await self._send(
+            method, f"{self.BASE_URL}{path}", json=body, headers=headers
+        )
+        if response.status_code == 304 and cache is not None and cached is not None:
+            cache.touch(key)
+            return _loads(cached.body)
+        response.raise_for_status()
+        if cache is not None:
+            cache.set(key, response.content, response.headers.get("ETag"))
+        return _loads(response.content)
 
     async def _query(self, body: dict) -> list[dict]:
         """Query OSV API.
 
+        Records from an earlier prefetch() are used when available; otherwise
+        this is a single /query request, which returns full records and so
+        needs no per-ID hydration.
+
         Args:
             body: Request body for OSV query.
 
         Returns:
             List of vulnerability records.
         """
-        client = await self._get_client()
-        url = f"{self.BASE_URL}/query"
-
-        try:
-            response = await client.post(url, json=body)
-            response.raise_for_status()
-            data = response.json()
-            return data.get("vulns", [])
-        except httpx.HTTPStatusError:
-            return []
-        finally:
-            if self._client is None:
-                await client.aclose()
+        prefetched = self._prefetched.pop(ResponseCache.make_key(body), None)
+        if prefetched is not None:
+            return prefetched
+        data = await self._request_json("POST", "/query", body)
+        return data.get("vulns", [])
 
     async def fetch_by_package(
         self,
@@ -77,16 +279,9 @@ class OSVFetcher:
         Returns:
             List of OSV vulnerability records.
         """
-        osv_ecosystem = self.ECOSYSTEM_MAP.get(ecosystem)
-        if not osv_ecosystem:
+        body = self._package_query(package_name, ecosystem)
+        if body is None:
             return []
-
-        body = {
-            "package": {
-                "name": package_name,
-                "ecosystem": osv_ecosystem,
-            }
-        }
         return await self._query(body)
 
     async def fetch_by_repo(
@@ -114,11 +309,105 @@ class OSVFetcher:
         }
         return await self._query(body)
 
-    def _parse_severity(self, vuln: dict) -> tuple[str, float | None]:
+    def _package_query(
+        self,
+        package_name: str,
+        ecosystem: str,
+        owner: str | None = None,
+        repo: str | None = None,
+    ) -> dict | None:
+        """Build the OSV query for a package, or None if OSV can't look it up."""
+        if ecosystem == "homebrew" and owner and repo:
+            return {"package": {"purl": f"pkg:github/{owner}/{repo}"}}
+        osv_ecosystem = self.ECOSYSTEM_MAP.get(ecosystem)
+        if not osv_ecosystem:
+            return None
+        return {"package": {"name": package_name, "ecosystem": osv_ecosystem}}
+
+    async def _fetch_vuln(self, vuln_id: str) -> dict:
+        """Fetch a full vulnerability record by ID."""
+        return await self._request_json("GET", f"/vulns/{vuln_id}")
+
+    async def fetch_batch(self, queries: list[dict]) -> list[list[dict]]:
+        """Fetch vulnerabilities for many OSV queries with /querybatch.
+
+        The batch endpoint only returns vulnerability IDs, a page at a time, so
+        further pages are requested while OSV hands out a next_page_token and
+        each distinct ID is then fetched concurrently (bounded by
+        MAX_CONCURRENT_REQUESTS).
+
+        Args:
+            queries: OSV query bodies, as sent to /query.
+
+        Returns:
+            Full vulnerability records for each query, in query order.
+
+        Raises:
+            httpx.HTTPStatusError: If a batch query or any record lookup fails.
+        """
+        ids_per_query: list[list[str]] = [[] for _ in queries]
+        page_tokens: dict[int, str] = {}
+        pending = list(range(len(queries)))
+        while pending:
+            next_pending = []
+            for start in range(0, len(pending), self.BATCH_SIZE):
+                indices = pending[start:start + self.BATCH_SIZE]
+                chunk = [
+                    {**queries[i], "page_token": page_tokens[i]} if i in page_tokens
+                    else queries[i]
+                    for i in indices
+                ]
+                data = await self._request_json("POST", "/querybatch", {"queries": chunk})
+                results = data.get("results", [])
+                for n, i in enumerate(indices):
+                    result = results[n] if n < len(results) else {}
+                    ids_per_query[i].extend(
+                        v["id"] for v in result.get("vulns", []) if v.get("id")
+                    )
+                    if result.get("next_page_token"):
+                        page_tokens[i] = result["next_page_token"]
+                        next_pending.append(i)
+            pending = next_pending
+
+        # Advisories often cover several packages; fetch each one once
+        unique_ids = list(dict.fromkeys(i for ids in ids_per_query for i in ids))
+        records = await asyncio.gather(*(self._fetch_vuln(i) for i in unique_ids))
+        by_id = dict(zip(unique_ids, records, strict=True))
+        return [[by_id[i] for i in ids] for ids in ids_per_query]
+
+    async def prefetch(self, packages: list[tuple[str, str]]) -> None:
+        """Look up many packages with one batch query ahead of their analysis.
+
+        fetch_cve_history then takes each package's records from here instead
+        of querying OSV on its own. Records left over from an earlier call are
+        dropped.
+
+        Args:
+            packages: (package_name, ecosystem) pairs.
+
+        Raises:
+            httpx.HTTPStatusError: If the lookup fails; nothing is kept then.
+        """
+        self._prefetched = {}
+        queries = [
+            query for name, ecosystem in packages
+            if (query := self._package_query(name, ecosystem)) is not None
+        ]
+        results = await self.fetch_batch(queries)
+        self._prefetched = {
+            ResponseCache.make_key(query): vulns
+            for query, vulns in zip(queries, results, strict=True)
+        }
+
+    def _parse_severity(
+        self, vuln: dict, ecosystem_severity: str | None = None
+    ) -> tuple[str, float | None]:
         """Extract severity and CVSS score from OSV record.
 
         Args:
             vuln: OSV vulnerability record.
+            ecosystem_severity: Severity from affected[].ecosystem_specific, which
+                overrides everything else (see _parse_affected).
 
         Returns:
             Tuple of (severity_string, cvss_score).
@@ -134,17 +423,19 @@ class OSVFetcher:
                 # Extract score from CVSS vector or use direct score
                 if isinstance(score_str, (int, float)):
                     cvss_score = float(score_str)
-                elif "/" in score_str:
-                    # Parse CVSS vector string (e.g., "CVSS:3.1/AV:N/AC:L/...")
-                    # The base score is often in database_specific
-                    pass
+                elif score_str.startswith("CVSS:3"):
+                    # Calculate from the vector string (e.g., "CVSS:3.1/AV:N/AC:L/...");
+                    # a score in database_specific still takes precedence below
+                    cvss_score = _cvss3_base_score(score_str)
 
         # Check database_specific for CVSS
         db_specific = vuln.get("database_specific", {})
         if "cvss" in db_specific:
             cvss_data = db_specific["cvss"]
             if isinstance(cvss_data, dict):
-                cvss_score = cvss_data.get("score")
+                # A null score keeps the one computed from the vector
+                if cvss_data.get("score") is not None:
+                    cvss_score = cvss_data["score"]
             elif isinstance(cvss_data, (int, float)):
                 cvss_score = float(cvss_data)
 
@@ -163,30 +454,44 @@ class OSVFetcher:
             else:
                 severity = "LOW"
 
-        # Check ecosystem_specific for npm/pypi severity
-        for eco_data in vuln.get("affected", []):
-            eco_specific = eco_data.get("ecosystem_specific", {})
-            if "severity" in eco_specific:
-                severity = eco_specific["severity"].upper()
-                break
+        # The npm/pypi ecosystem_specific severity wins
+        if ecosystem_severity is not None:
+            severity = ecosystem_severity
 
         return severity, cvss_score
 
-    def _parse_fixed_version(self, vuln: dict) -> str | None:
-        """Extract the first fixed version from OSV record.
+    def _parse_affected(self, vuln: dict) -> tuple[str | None, str | None]:
+        """Extract the ecosystem-specific severity and first fixed version.
+
+        Both live under affected[], so it is walked once and left as soon as
+        both have been found.
 
         Args:
             vuln: OSV vulnerability record.
 
         Returns:
-            Fixed version string or None.
+            Tuple of (ecosystem_severity, fixed_version); either may be None.
         """
-        for affected in vuln.get("affected", []):
-            for rng in affected.get("ranges", []):
-                for event in rng.get("events", []):
-                    if "fixed" in event:
-                        return event["fixed"]
-        return None
+        severity = None
+        fixed_version = None
+        for affected in vuln.get("affected", ()):
+            if severity is None:
+                eco_specific = affected.get("ecosystem_specific") or {}
+                if "severity" in eco_specific:
+                    severity = eco_specific["severity"].upper()
+            if fixed_version is None:
+                fixed_version = next(
+                    (
+                        event["fixed"]
+                        for rng in affected.get("ranges", ())
+                        for event in rng.get("events", ())
+                        if "fixed" in event
+                    ),
+                    None,
+                )
+            if severity is not None and fixed_version is not None:
+                break
+        return severity, fixed_version
 
     def _parse_references(self, vuln: dict) -> list[str]:
         """Extract reference URLs from OSV record.
@@ -198,41 +503,37 @@ class OSVFetcher:
             List of reference URLs.
         """
         refs = []
-        for ref in vuln.get("references", []):
+        for ref in vuln.get("references", ()):
             url = ref.get("url")
             if url:
                 refs.append(url)
-        return refs[:5]  # Limit to 5 references
+                if len(refs) == 5:  # Limit to 5 references
+                    break
+        return refs
 
-    def _find_release_date(
-        self,
-        version: str,
-        releases: ReleaseStats | None,
-        release_dates: dict[str, datetime] | None = None,
-    ) -> datetime | None:
-        """Find the release date for a specific version.
+    def _normalize_release_dates(
+        self, release_dates: dict[str, datetime]
+    ) -> dict[str, datetime]:
+        """Index release dates under both the tagged and the bare version.
+
+        Tags like "v1.2.0" are also found as "1.2.0" and vice versa, so each
+        lookup is a single dict access. Exact tags win over variants. Naive
+        dates are taken as UTC.
 
         Args:
-            version: Version string to find.
-            releases: ReleaseStats from GitHub data.
-            release_dates: Optional dict mapping version -> release date.
+            release_dates: Dict mapping version strings to release dates.
 
         Returns:
-            Release datetime or None.
+            A new dict with the extra keys and timezone-aware dates.
         """
-        if release_dates and version in release_dates:
-            return release_dates[version]
-
-        # Try common version formats
-        if release_dates:
-            # Try with 'v' prefix
-            if f"v{version}" in release_dates:
-                return release_dates[f"v{version}"]
-            # Try without 'v' prefix
-            if version.startswith("v") and version[1:] in release_dates:
-                return release_dates[version[1:]]
-
-        return None
+        normalized = {
+            version: date if date.tzinfo else date.replace(tzinfo=timezone.utc)
+            for version, date in release_dates.items()
+        }
+        for version, date in list(normalized.items()):
+            bare = version.removeprefix("v")
+            normalized.setdefault(bare if bare != version else f"v{version}", date)
+        return normalized
 
     async def fetch_cve_history(
         self,
@@ -255,6 +556,9 @@ class OSVFetcher:
 
         Returns:
             CVEHistory with all vulnerabilities and patch timing.
+
+        Raises:
+            httpx.HTTPStatusError: If OSV can't be queried.
         """
         # Fetch vulnerabilities
         if ecosystem == "homebrew" and owner and repo:
@@ -262,9 +566,54 @@ class OSVFetcher:
         else:
             vulns = await self.fetch_by_package(package_name, ecosystem)
 
+        return self._build_history(vulns, releases, release_dates)
+
+    async def fetch_cve_histories(
+        self, packages: list[tuple[str, str]]
+    ) -> list[CVEHistory]:
+        """Fetch CVE histories for many packages with one batch query.
+
+        Patch timing needs each package's release dates, so it isn't
+        calculated here; use fetch_cve_history for a single package with them.
+
+        Args:
+            packages: (package_name, ecosystem) pairs.
+
+        Returns:
+            CVEHistory for each package, in order.
+
+        Raises:
+            httpx.HTTPStatusError: If OSV can't be queried.
+        """
+        queries = [self._package_query(name, ecosystem) for name, ecosystem in packages]
+        results = iter(await self.fetch_batch([q for q in queries if q is not None]))
+        return [
+            self._build_history(next(results) if q is not None else [])
+            for q in queries
+        ]
+
+    def _build_history(
+        self,
+        vulns: list[dict],
+        releases: ReleaseStats | None = None,
+        release_dates: dict[str, datetime] | None = None,
+    ) -> CVEHistory:
+        """Build a CVEHistory from OSV vulnerability records.
+
+        Args:
+            vulns: OSV vulnerability records.
+            releases: ReleaseStats from GitHub for patch timing.
+            release_dates: Optional dict mapping version strings to release dates.
+
+        Returns:
+            CVEHistory with all vulnerabilities and patch timing.
+        """
         if not vulns:
             return CVEHistory(total_cves=0, cves=[], has_unpatched=False)
 
+        if release_dates:
+            release_dates = self._normalize_release_dates(release_dates)
+
         cve_details = []
         total_patch_days = 0
         patched_count = 0
@@ -274,39 +623,32 @@ class OSVFetcher:
             # Parse basic info
             vuln_id = vuln.get("id", "UNKNOWN")
             summary = vuln.get("summary", "") or vuln.get("details", "")[:200]
-            severity, cvss_score = self._parse_severity(vuln)
+            ecosystem_severity, fixed_version = self._parse_affected(vuln)
+            severity, cvss_score = self._parse_severity(vuln, ecosystem_severity)
 
             # Parse dates
             published_str = vuln.get("published")
             published_date = None
             if published_str:
                 try:
-                    published_date = datetime.fromisoformat(
-                        published_str.replace("Z", "+00:00")
-                    )
+                    published_date = _parse_datetime(published_str)
                 except ValueError:
                     published_date = datetime.now(timezone.utc)
+                else:
+                    # OSV stamps are UTC; only an offset-less one needs fixing up
+                    if published_date.tzinfo is None:
+                        published_date = published_date.replace(tzinfo=timezone.utc)
             else:
                 published_date = datetime.now(timezone.utc)
 
-            # Parse fixed version and calculate patch time
-            fixed_version = self._parse_fixed_version(vuln)
+            # Calculate patch time from the fixed version
             patch_release_date = None
             days_to_patch = None
 
             if fixed_version and release_dates:
-                patch_release_date = self._find_release_date(
-                    fixed_version, releases, release_dates
-                )
-                if patch_release_date and published_date:
-                    # Ensure both are timezone-aware for comparison
-                    if patch_release_date.tzinfo is None:
-                        patch_release_date = patch_release_date.replace(
-                            tzinfo=timezone.utc
-                        )
-                    if published_date.tzinfo is None:
-                        published_date = published_date.replace(tzinfo=timezone.utc)
-
+                # Both dates are timezone-aware by now
+                patch_release_date = release_dates.get(fixed_version)
+                if patch_release_date:
                     delta = patch_release_date - published_date
                     days_to_patch = max(0, delta.days)
                     total_patch_days += days_to_patch
@@ -333,10 +675,11 @@ class OSVFetcher:
                 )
             )
 
-        # Sort by severity (CRITICAL first) then by date (newest first)
-        severity_order = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3, "UNKNOWN": 4}
+        # Sort by severity (CRITICAL first) then by date (newest first). The
+        # key is computed once per CVE, not per comparison.
+        rank = self.SEVERITY_RANK
         cve_details.sort(
-            key=lambda c: (severity_order.get(c.severity, 4), -c.published_date.timestamp())
+            key=lambda c: (rank.get(c.severity, 4), -c.published_date.timestamp())
         )
 
         # Calculate average days to patch
@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 import json
+import logging
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
 from pkgrisk.adapters.base import BaseAdapter
+from pkgrisk.analyzers.cache import ResponseCache, default_cache_dir
 from pkgrisk.analyzers.deps_dev import DepsDevFetcher
 from pkgrisk.analyzers.github import GitHubFetcher
 from pkgrisk.analyzers.llm import LLMAnalyzer
@@ -19,8 +23,10 @@ from pkgrisk.analyzers.scorer import Scorer
 from pkgrisk.analyzers.supply_chain import SupplyChainAnalyzer
 from pkgrisk.models.schemas import (
     AggregatorData,
+    CVEHistory,
     DataAvailability,
     Ecosystem,
+    GitHubData,
     LLMAssessments,
     PackageAnalysis,
     Platform,
@@ -30,6 +36,8 @@ from pkgrisk.models.schemas import (
 if TYPE_CHECKING:
     from pkgrisk.monitoring import MetricsCollector
 
+logger = logging.getLogger(__name__)
+
 
 class AnalysisPipeline:
     """Orchestrates the full analysis pipeline for packages.
@@ -67,25 +75,52 @@ class AnalysisPipeline:
         """
         self.adapter = adapter
         self.data_dir = data_dir or Path("data")
-        self.github = GitHubFetcher(token=github_token)
-        self.osv = OSVFetcher()
-        self.deps_dev = DepsDevFetcher()
-        self.llm = LLMAnalyzer(model=llm_model, fast_model=llm_fast_model) if not skip_llm else None
-        self.supply_chain = SupplyChainAnalyzer() if not skip_supply_chain else None
+        # One connection pool for the OSV, deps.dev and npm tarball requests.
+        # GitHub and Ollama keep their own clients (auth headers, long timeouts).
+        self._http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            http2=importlib.util.find_spec("h2") is not None,
+        )
+        self.http_cache = ResponseCache(default_cache_dir() / "github.sqlite")
+        self.github = GitHubFetcher(token=github_token, cache=self.http_cache)
+        self.osv_cache = ResponseCache(default_cache_dir() / "osv.sqlite", max_entries=20_000)
+        self.osv = OSVFetcher(client=self._http_client, cache=self.osv_cache)
+        self.deps_dev = DepsDevFetcher(client=self._http_client)
+        self.llm_cache = (
+            ResponseCache(default_cache_dir() / "llm.sqlite", max_entries=5_000)
+            if not skip_llm
+            else None
+        )
+        self.llm = (
+            LLMAnalyzer(model=llm_model, fast_model=llm_fast_model, cache=self.llm_cache)
+            if not skip_llm
+            else None
+        )
+        self.supply_chain = (
+            SupplyChainAnalyzer(client=self._http_client) if not skip_supply_chain else None
+        )
         self.scorer = Scorer()
         self.metrics = metrics
         self.parallel_llm = False  # Run LLM calls in parallel for better GPU utilization
-        self._http_client: httpx.AsyncClient | None = None
+
+    async def aclose(self) -> None:
+        """Close the HTTP clients and response caches."""
+        await self._http_client.aclose()
+        await self.github.aclose()
+        await self.osv.aclose()
+        if self.llm:
+            await self.llm.aclose()
+        self.http_cache.close()
+        self.osv_cache.close()
+        if self.llm_cache:
+            self.llm_cache.close()
 
     async def __aenter__(self) -> "AnalysisPipeline":
-        """Set up shared HTTP client."""
-        self._http_client = httpx.AsyncClient(timeout=60.0)
         return self
 
     async def __aexit__(self, *args) -> None:
-        """Clean up HTTP client."""
-        if self._http_client:
-            await self._http_client.aclose()
+        await self.aclose()
 
     def _record_timing(self, stage: str, duration: float) -> None:
         """Record stage timing if metrics collector is available."""
@@ -110,8 +145,11 @@ class AnalysisPipeline:
 
         # Stage 1: Fetch package metadata
         t0 = time.perf_counter()
-        metadata = await self.adapter.get_package_metadata(package_name)
-        install_stats = await self.adapter.get_install_stats(package_name)
+        # Install counts come from a separate endpoint, so fetch both at once
+        metadata, install_stats = await asyncio.gather(
+            self.adapter.get_package_metadata(package_name),
+            self.adapter.get_install_stats(package_name),
+        )
         repo_ref = self.adapter.get_source_repo(metadata)
         install_count = install_stats.downloads_last_30d if install_stats else None
         self._record_timing("metadata", time.perf_counter() - t0)
@@ -148,57 +186,43 @@ class AnalysisPipeline:
                 data_availability = DataAvailability.REPO_NOT_FOUND
                 unavailable_reason = f"Repository {repo_ref.owner}/{repo_ref.repo} not accessible (may be private, deleted, or renamed)"
 
-        # Stage 2.5: Fetch CVE history from OSV
-        if github_data and repo_ref:
-            try:
-                t0 = time.perf_counter()
-                # Fetch release dates for time-to-patch calculation
-                release_dates = await self.github.fetch_release_dates(
-                    repo_ref.owner, repo_ref.repo
-                )
-
-                # Fetch CVE history
-                cve_history = await self.osv.fetch_cve_history(
-                    package_name=package_name,
-                    ecosystem=ecosystem.value,
-                    releases=github_data.releases,
-                    owner=repo_ref.owner,
-                    repo=repo_ref.repo,
-                    release_dates=release_dates,
-                )
-                self._record_timing("cve", time.perf_counter() - t0)
-
-                # Attach to security data and update known_cves count
-                github_data.security.cve_history = cve_history
-                github_data.security.known_cves = cve_history.total_cves
+        # Stages 2.5-2.7 hit different services (OSV, npm, deps.dev) and don't
+        # depend on each other, so they run concurrently
+        async def fetch_cve() -> CVEHistory | None:
+            # Stage 2.5: Fetch CVE history from OSV
+            if not (github_data and repo_ref):
+                return None
+            t0 = time.perf_counter()
+            # Fetch release dates for time-to-patch calculation
+            release_dates = await self.github.fetch_release_dates(
+                repo_ref.owner, repo_ref.repo
+            )
 
-                # Update OSV status
-                if self.metrics:
-                    self.metrics.update_osv_status("OK")
-            except Exception:
-                if self.metrics:
-                    self.metrics.update_osv_status("error")
-                pass  # CVE fetching failures shouldn't break pipeline
+            # Fetch CVE history
+            cve_history = await self.osv.fetch_cve_history(
+                package_name=package_name,
+                ecosystem=ecosystem.value,
+                releases=github_data.releases,
+                owner=repo_ref.owner,
+                repo=repo_ref.repo,
+                release_dates=release_dates,
+            )
+            self._record_timing("cve", time.perf_counter() - t0)
+            return cve_history
 
-        # Stage 2.6: Supply chain analysis (NPM only for now)
-        supply_chain_data = None
-        if self.supply_chain and ecosystem == Ecosystem.NPM:
-            try:
-                t0 = time.perf_counter()
-                supply_chain_data = await self._run_supply_chain_analysis(
-                    package_name, repo_ref
-                )
-                self._record_timing("supply_chain", time.perf_counter() - t0)
-            except Exception as e:
-                # Supply chain analysis failures shouldn't break pipeline
-                import logging
-                logging.getLogger(__name__).debug(
-                    f"Supply chain analysis failed for {package_name}: {e}"
-                )
+        async def fetch_supply_chain() -> SupplyChainData | None:
+            # Stage 2.6: Supply chain analysis (NPM only for now)
+            if not (self.supply_chain and ecosystem == Ecosystem.NPM):
+                return None
+            t0 = time.perf_counter()
+            supply_chain_data = await self._run_supply_chain_analysis(
+                package_name, repo_ref
+            )
+            self._record_timing("supply_chain", time.perf_counter() - t0)
+            return supply_chain_data
 
-        # Stage 2.7: Fetch deps.dev aggregator data (cross-forge intelligence)
-        aggregator_data = None
-        try:
+        async def fetch_aggregator() -> AggregatorData | None:
+            # Stage 2.7: Fetch deps.dev aggregator data (cross-forge intelligence)
             t0 = time.perf_counter()
             aggregator_data = await self.deps_dev.fetch_all_intelligence(
                 package_name=package_name,
@@ -207,24 +231,49 @@ class AnalysisPipeline:
                 repo_ref=repo_ref,
             )
             self._record_timing("deps_dev", time.perf_counter() - t0)
+            return aggregator_data
 
-            # If we have project data for a non-GitHub repo, upgrade status
-            # This includes Scorecard (GitHub) or basic metrics (GitLab/Bitbucket)
-            if (
-                data_availability == DataAvailability.NOT_GITHUB
-                and aggregator_data
-                and aggregator_data.has_project_data
-            ):
-                data_availability = DataAvailability.PARTIAL_FORGE
-                unavailable_reason = (
-                    f"Repository is on {repo_ref.platform.value}. "
-                    f"Using deps.dev for cross-forge analysis."
-                )
-        except Exception as e:
-            # deps.dev failures shouldn't break pipeline
-            import logging
-            logging.getLogger(__name__).debug(
-                f"deps.dev fetch failed for {package_name}: {e}"
+        cve_history, supply_chain_data, aggregator_data = await asyncio.gather(
+            fetch_cve(), fetch_supply_chain(), fetch_aggregator(),
+            return_exceptions=True,
+        )
+
+        # Failures in any of these stages shouldn't break the pipeline
+        if isinstance(cve_history, BaseException):
+            if self.metrics:
+                self.metrics.update_osv_status("error")
+        elif cve_history is not None and github_data is not None:
+            # Attach to security data and update known_cves count
+            github_data.security.cve_history = cve_history
+            github_data.security.known_cves = cve_history.total_cves
+
+            # Update OSV status
+            if self.metrics:
+                self.metrics.update_osv_status("OK")
+
+        if isinstance(supply_chain_data, BaseException):
+            logger.debug(
+                f"Supply chain analysis failed for {package_name}: {supply_chain_data}"
+            )
+            supply_chain_data = None
+
+        if isinstance(aggregator_data, BaseException):
+            logger.debug(
+                f"deps.dev fetch failed for {package_name}: {aggregator_data}"
+            )
+            aggregator_data = None
+
+        # If we have project data for a non-GitHub repo, upgrade status
+        # This includes Scorecard (GitHub) or basic metrics (GitLab/Bitbucket)
+        if (
+            data_availability == DataAvailability.NOT_GITHUB
+            and aggregator_data
+            and aggregator_data.has_project_data
+        ):
+            data_availability = DataAvailability.PARTIAL_FORGE
+            unavailable_reason = (
+                f"Repository is on {repo_ref.platform.value}. "
+                f"Using deps.dev for cross-forge analysis."
             )
 
         # Stage 3: Run LLM assessments (only if we have GitHub data)
@@ -310,7 +359,7 @@ class AnalysisPipeline:
         ecosystem: str,
         owner: str,
         repo: str,
-        github_data,
+        github_data: GitHubData,
         parallel: bool = False,
     ) -> LLMAssessments:
         """Run all LLM assessments for a package.
@@ -334,114 +383,81 @@ class AnalysisPipeline:
             package_name, ecosystem, owner, repo, github_data
         )
 
+    @staticmethod
+    def _maintenance_inputs(github_data: GitHubData) -> dict[str, Any]:
+        """Build the assess_maintenance arguments from GitHub activity data."""
+        last_commit = github_data.commits.last_commit_date
+        last_release = github_data.releases.last_release_date
+
+        # Use merged_prs if available, otherwise fall back to closed_prs
+        # (some projects merge via CLI, so merged_at is never populated)
+        pr_activity = github_data.prs.merged_prs_6mo
+        if pr_activity == 0:
+            pr_activity = github_data.prs.closed_prs_6mo
+
+        return {
+            "last_commit_date": last_commit.isoformat() if last_commit else "unknown",
+            "commit_count": github_data.commits.commits_last_6mo,
+            "open_issues": github_data.issues.open_issues,
+            "closed_issues": github_data.issues.closed_issues_6mo,
+            "open_prs": github_data.prs.open_prs,
+            "merged_prs": pr_activity,
+            "last_release_date": last_release.isoformat() if last_release else None,
+            "active_contributors": github_data.contributors.active_contributors_6mo,
+        }
+
     async def _run_llm_assessments_sequential(
         self,
         package_name: str,
         ecosystem: str,
         owner: str,
         repo: str,
-        github_data,
+        github_data: GitHubData,
     ) -> LLMAssessments:
-        """Run LLM assessments sequentially (original behavior)."""
+        """Run LLM assessments one model at a time.
+
+        The content is still fetched concurrently up front. The primary-model
+        assessments run one after the other, then the fast-model ones are
+        submitted together, so the models are swapped at most once.
+        """
         assessments = LLMAssessments()
+        content = await self.github.fetch_llm_content(owner, repo, github_data)
 
         # 1. README assessment
-        if github_data.files.has_readme:
-            readme_content = await self.github.fetch_readme_content(owner, repo)
-            if readme_content:
-                try:
-                    assessments.readme = await self.llm.assess_readme(
-                        readme_content, package_name, ecosystem
-                    )
-                except Exception:
-                    pass  # LLM failures shouldn't break pipeline
-
-        # 2. Sentiment assessment from issues
-        try:
-            issues = await self.github.fetch_recent_issues(owner, repo, limit=15)
-            if issues:
-                assessments.sentiment = await self.llm.assess_sentiment(
-                    issues, package_name, ecosystem
-                )
-        except Exception:
-            pass
-
-        # 3. Communication assessment from maintainer comments
-        try:
-            comments = await self.github.fetch_maintainer_comments(owner, repo, limit=30)
-            if comments and len(comments) >= 5:  # Need enough comments for meaningful analysis
-                assessments.communication = await self.llm.assess_communication(
-                    comments, package_name, ecosystem
-                )
-        except Exception:
-            pass
-
-        # 4. Maintenance assessment
-        try:
-            last_commit = github_data.commits.last_commit_date
-            last_commit_str = last_commit.isoformat() if last_commit else "unknown"
-            last_release = github_data.releases.last_release_date
-            last_release_str = last_release.isoformat() if last_release else None
-
-            # Use merged_prs if available, otherwise fall back to closed_prs
-            # (some projects merge via CLI, so merged_at is never populated)
-            pr_activity = github_data.prs.merged_prs_6mo
-            if pr_activity == 0:
-                pr_activity = github_data.prs.closed_prs_6mo
-
-            assessments.maintenance = await self.llm.assess_maintenance(
-                last_commit_date=last_commit_str,
-                commit_count=github_data.commits.commits_last_6mo,
-                open_issues=github_data.issues.open_issues,
-                closed_issues=github_data.issues.closed_issues_6mo,
-                open_prs=github_data.prs.open_prs,
-                merged_prs=pr_activity,
-                last_release_date=last_release_str,
-                active_contributors=github_data.contributors.active_contributors_6mo,
-                package_name=package_name,
-                ecosystem=ecosystem,
-            )
-        except Exception:
-            pass
-
-        # 5. Changelog assessment
-        if github_data.files.has_changelog:
+        if content.readme:
             try:
-                changelog_content = await self.github.fetch_changelog_content(owner, repo)
-                if changelog_content:
-                    assessments.changelog = await self.llm.assess_changelog(
-                        changelog_content, package_name, ecosystem
-                    )
+                assessments.readme = await self.llm.assess_readme(
+                    content.readme, package_name, ecosystem
+                )
             except Exception:
-                pass
+                pass  # LLM failures shouldn't break pipeline
 
-        # 6. Governance assessment
-        if github_data.files.has_contributing or github_data.files.has_governance:
+        # 2. Security code analysis
+        if content.code_samples:
             try:
-                governance_docs = await self.github.fetch_governance_docs(owner, repo)
-                if governance_docs:
-                    assessments.governance = await self.llm.assess_governance(
-                        governance_docs, package_name, ecosystem
-                    )
+                assessments.security = await self.llm.assess_security(
+                    content.code_samples, package_name, ecosystem
+                )
             except Exception:
                 pass
 
-        # 7. Security code analysis
+        # 3. Sentiment, communication, maintenance, changelog and governance
+        comments = content.maintainer_comments
         try:
-            code_samples = await self.github.fetch_source_files_for_security(
-                owner,
-                repo,
-                language=github_data.repo.language,
-                default_branch=github_data.repo.default_branch,
-                max_bytes=15000,
-                max_files=10,
+            fast = await self.llm.assess_all_fast(
+                package_name,
+                ecosystem,
+                issues=content.issues,
+                # Need enough comments for meaningful analysis
+                comments=comments if comments and len(comments) >= 5 else None,
+                maintenance=self._maintenance_inputs(github_data),
+                changelog_content=content.changelog,
+                governance_docs=content.governance,
             )
-            if code_samples:
-                assessments.security = await self.llm.assess_security(
-                    code_samples, package_name, ecosystem
-                )
         except Exception:
-            pass
+            fast = {}
+        for key, result in fast.items():
+            setattr(assessments, key, result)
 
         return assessments
 
@@ -451,115 +467,65 @@ class AnalysisPipeline:
         ecosystem: str,
         owner: str,
         repo: str,
-        github_data,
+        github_data: GitHubData,
     ) -> LLMAssessments:
         """Run LLM assessments in parallel for better GPU utilization.
 
         This fetches all content first, then runs all LLM calls concurrently.
         Can improve GPU utilization from ~50% to ~80-90% by keeping the GPU busy.
         """
-        import asyncio
-
         assessments = LLMAssessments()
 
         # Phase 1: Fetch all content in parallel (network I/O)
-        fetch_tasks = {}
-
-        if github_data.files.has_readme:
-            fetch_tasks["readme"] = self.github.fetch_readme_content(owner, repo)
-
-        fetch_tasks["issues"] = self.github.fetch_recent_issues(owner, repo, limit=15)
-        fetch_tasks["comments"] = self.github.fetch_maintainer_comments(owner, repo, limit=30)
-
-        if github_data.files.has_changelog:
-            fetch_tasks["changelog"] = self.github.fetch_changelog_content(owner, repo)
-
-        if github_data.files.has_contributing or github_data.files.has_governance:
-            fetch_tasks["governance"] = self.github.fetch_governance_docs(owner, repo)
-
-        fetch_tasks["code_samples"] = self.github.fetch_source_files_for_security(
-            owner,
-            repo,
-            language=github_data.repo.language,
-            default_branch=github_data.repo.default_branch,
-            max_bytes=15000,
-            max_files=10,
-        )
-
-        # Execute all fetches concurrently
-        fetch_results = {}
-        if fetch_tasks:
-            keys = list(fetch_tasks.keys())
-            results = await asyncio.gather(
-                *fetch_tasks.values(),
-                return_exceptions=True,
-            )
-            for key, result in zip(keys, results):
-                if not isinstance(result, Exception):
-                    fetch_results[key] = result
+        content = await self.github.fetch_llm_content(owner, repo, github_data)
 
         # Phase 2: Run all LLM assessments in parallel (GPU work)
         llm_tasks = {}
 
         # README assessment
-        readme_content = fetch_results.get("readme")
+        readme_content = content.readme
         if readme_content:
             llm_tasks["readme"] = self.llm.assess_readme(
                 readme_content, package_name, ecosystem
             )
 
         # Sentiment assessment
-        issues = fetch_results.get("issues")
+        issues = content.issues
         if issues:
             llm_tasks["sentiment"] = self.llm.assess_sentiment(
                 issues, package_name, ecosystem
             )
 
         # Communication assessment
-        comments = fetch_results.get("comments")
+        comments = content.maintainer_comments
         if comments and len(comments) >= 5:
             llm_tasks["communication"] = self.llm.assess_communication(
                 comments, package_name, ecosystem
             )
 
         # Maintenance assessment (uses github_data, no fetch needed)
-        last_commit = github_data.commits.last_commit_date
-        last_commit_str = last_commit.isoformat() if last_commit else "unknown"
-        last_release = github_data.releases.last_release_date
-        last_release_str = last_release.isoformat() if last_release else None
-        pr_activity = github_data.prs.merged_prs_6mo
-        if pr_activity == 0:
-            pr_activity = github_data.prs.closed_prs_6mo
-
         llm_tasks["maintenance"] = self.llm.assess_maintenance(
-            last_commit_date=last_commit_str,
-            commit_count=github_data.commits.commits_last_6mo,
-            open_issues=github_data.issues.open_issues,
-            closed_issues=github_data.issues.closed_issues_6mo,
-            open_prs=github_data.prs.open_prs,
-            merged_prs=pr_activity,
-            last_release_date=last_release_str,
-            active_contributors=github_data.contributors.active_contributors_6mo,
+            **self._maintenance_inputs(github_data),
             package_name=package_name,
             ecosystem=ecosystem,
         )
 
         # Changelog assessment
-        changelog_content = fetch_results.get("changelog")
+        changelog_content = content.changelog
         if changelog_content:
             llm_tasks["changelog"] = self.llm.assess_changelog(
                 changelog_content, package_name, ecosystem
             )
 
         # Governance assessment
-        governance_docs = fetch_results.get("governance")
+        governance_docs = content.governance
         if governance_docs:
             llm_tasks["governance"] = self.llm.assess_governance(
                 governance_docs, package_name, ecosystem
             )
 
         # Security assessment
-        code_samples = fetch_results.get("code_samples")
+        code_samples = content.code_samples
         if code_samples:
             llm_tasks["security"] = self.llm.assess_security(
                 code_samples, package_name, ecosystem
@@ -855,6 +821,21 @@ class AnalysisPipeline:
 
         return filepath
 
+    async def prefetch_cves(self, package_names: list[str]) -> None:
+        """Look up CVEs for a batch of packages with one OSV batch query.
+
+        analyze_package then uses each package's records without querying OSV
+        again. On failure the packages are simply queried one at a time.
+
+        Args:
+            package_names: Packages about to be analyzed.
+        """
+        ecosystem = self.adapter.ecosystem.value
+        try:
+            await self.osv.prefetch([(name, ecosystem) for name in package_names])
+        except Exception as e:
+            logger.debug(f"OSV batch prefetch failed: {e}")
+
     async def analyze_packages(
         self,
         limit: int | None = None,
@@ -873,6 +854,7 @@ class AnalysisPipeline:
         packages = await self.adapter.list_packages(limit=limit)
         total = len(packages)
         results = []
+        await self.prefetch_cves(packages)
 
         for i, package_name in enumerate(packages):
             if progress_callback:
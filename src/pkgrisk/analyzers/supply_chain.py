@@ -408,7 +408,8 @@ class SupplyChainAnalyzer:
 
         try:
             client = await self._get_client()
-            response = await client.get(tarball_url)
+            # Set per request, since an injected client may not follow redirects
+            response = await client.get(tarball_url, follow_redirects=True)
             response.raise_for_status()
 
             tarball_data = response.content
@@ -336,20 +336,20 @@ async def _analyze_package(
     ) as progress:
         task = progress.add_task("Analyzing package...", total=None)
 
-        pipeline = AnalysisPipeline(
+        async with AnalysisPipeline(
             adapter=adapter,
             github_token=os.environ.get("GITHUB_TOKEN"),
             skip_llm=skip_llm,
             llm_model=model,
-        )
-        pipeline.parallel_llm = parallel_llm
+        ) as pipeline:
+            pipeline.parallel_llm = parallel_llm
 
-        try:
-            progress.update(task, description="Fetching package data...")
-            analysis = await pipeline.analyze_package(package, save=False)
-        except Exception as e:
-            console.print(f"[red]Error analyzing package: {e}[/red]")
-            raise typer.Exit(1)
+            try:
+                progress.update(task, description="Fetching package data...")
+                analysis = await pipeline.analyze_package(package, save=False)
+            except Exception as e:
+                console.print(f"[red]Error analyzing package: {e}[/red]")
+                raise typer.Exit(1)
 
     from pkgrisk.models.schemas import DataAvailability
 
@@ -499,70 +499,71 @@ async def _analyze_batch(
     # Initialize metrics collector for monitoring
     metrics = MetricsCollector(data_dir / ".metrics.json")
 
-    pipeline = AnalysisPipeline(
+    async with AnalysisPipeline(
         adapter=adapter,
         data_dir=data_dir,
         github_token=os.environ.get("GITHUB_TOKEN"),
         skip_llm=skip_llm,
         metrics=metrics,
-    )
-
-    console.print(f"[bold]Analyzing top {limit} {ecosystem} packages...[/bold]")
-    console.print()
-
-    # Get packages first
-    packages = await adapter.list_packages(limit=limit)
-
-    # Start batch tracking
-    metrics.start_batch(len(packages), ecosystem)
-
-    # Check LLM availability
-    if pipeline.llm:
-        llm_available = await pipeline.llm.is_available()
-        metrics.update_llm_status(llm_available, pipeline.llm.model if llm_available else "")
-    else:
-        metrics.update_llm_status(False, "")
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        MofNCompleteColumn(),
-        TimeElapsedColumn(),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Analyzing...", total=len(packages))
-        results = []
-        errors = []
+    ) as pipeline:
+        console.print(f"[bold]Analyzing top {limit} {ecosystem} packages...[/bold]")
+        console.print()
 
-        for i, package_name in enumerate(packages):
-            progress.update(task, description=f"Analyzing {package_name}...", completed=i)
-            metrics.start_package(package_name)
+        # Get packages first
+        packages = await adapter.list_packages(limit=limit)
 
-            try:
-                analysis = await pipeline.analyze_package(package_name, save=True)
-                results.append(analysis)
-
-                # Record completion in metrics
-                if analysis.data_availability == DataAvailability.AVAILABLE and analysis.scores:
-                    metrics.complete_package(
-                        package_name,
-                        status="scored",
-                        score=analysis.scores.overall,
-                        grade=analysis.scores.grade,
-                    )
-                else:
-                    metrics.complete_package(
-                        package_name,
-                        status="unavailable",
-                        message=analysis.unavailable_reason,
-                    )
-            except Exception as e:
-                errors.append((package_name, str(e)))
-                metrics.record_error(package_name, type(e).__name__, str(e))
-                metrics.complete_package(package_name, status="error", message=str(e))
+        # Start batch tracking
+        metrics.start_batch(len(packages), ecosystem)
 
-        progress.update(task, completed=len(packages))
+        # Check LLM availability
+        if pipeline.llm:
+            llm_available = await pipeline.llm.is_available()
+            metrics.update_llm_status(llm_available, pipeline.llm.model if llm_available else "")
+        else:
+            metrics.update_llm_status(False, "")
+
+        await pipeline.prefetch_cves(packages)
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TimeElapsedColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task("Analyzing...", total=len(packages))
+            results = []
+            errors = []
+
+            for i, package_name in enumerate(packages):
+                progress.update(task, description=f"Analyzing {package_name}...", completed=i)
+                metrics.start_package(package_name)
+
+                try:
+                    analysis = await pipeline.analyze_package(package_name, save=True)
+                    results.append(analysis)
+
+                    # Record completion in metrics
+                    if analysis.data_availability == DataAvailability.AVAILABLE and analysis.scores:
+                        metrics.complete_package(
+                            package_name,
+                            status="scored",
+                            score=analysis.scores.overall,
+                            grade=analysis.scores.grade,
+                        )
+                    else:
+                        metrics.complete_package(
+                            package_name,
+                            status="unavailable",
+                            message=analysis.unavailable_reason,
+                        )
+                except Exception as e:
+                    errors.append((package_name, str(e)))
+                    metrics.record_error(package_name, type(e).__name__, str(e))
+                    metrics.complete_package(package_name, status="error", message=str(e))
+
+            progress.update(task, completed=len(packages))
 
     # Finish batch
     metrics.finish_batch()
@@ -787,39 +788,39 @@ async def _gpu_benchmark(
 
     # Run sequential benchmark
     console.print("[bold yellow]Running sequential LLM benchmark...[/bold yellow]")
-    pipeline_seq = AnalysisPipeline(
+    async with AnalysisPipeline(
         adapter=adapter,
         github_token=os.environ.get("GITHUB_TOKEN"),
         skip_llm=False,
         llm_model=model,
-    )
-    pipeline_seq.parallel_llm = False
-
-    seq_times = []
-    seq_llm_times = []
-    for pkg in packages:
-        console.print(f"  Analyzing {pkg}...")
-        start = time.perf_counter()
-        llm_start = None
-        llm_end = None
-
-        # Track LLM timing separately
-        original_record = pipeline_seq._record_timing
-        def track_llm(stage, duration):
-            nonlocal llm_start, llm_end
-            if stage == "llm":
-                seq_llm_times.append(duration)
-            original_record(stage, duration)
-        pipeline_seq._record_timing = track_llm
+    ) as pipeline_seq:
+        pipeline_seq.parallel_llm = False
 
-        try:
-            await pipeline_seq.analyze_package(pkg, save=False)
-        except Exception as e:
-            console.print(f"    [red]Error: {e}[/red]")
-            continue
-        total = time.perf_counter() - start
-        seq_times.append(total)
-        console.print(f"    [green]Done in {total:.1f}s[/green]")
+        seq_times = []
+        seq_llm_times = []
+        for pkg in packages:
+            console.print(f"  Analyzing {pkg}...")
+            start = time.perf_counter()
+            llm_start = None
+            llm_end = None
+
+            # Track LLM timing separately
+            original_record = pipeline_seq._record_timing
+            def track_llm(stage, duration):
+                nonlocal llm_start, llm_end
+                if stage == "llm":
+                    seq_llm_times.append(duration)
+                original_record(stage, duration)
+            pipeline_seq._record_timing = track_llm
+
+            try:
+                await pipeline_seq.analyze_package(pkg, save=False)
+            except Exception as e:
+                console.print(f"    [red]Error: {e}[/red]")
+                continue
+            total = time.perf_counter() - start
+            seq_times.append(total)
+            console.print(f"    [green]Done in {total:.1f}s[/green]")
 
     results["sequential"] = {
         "total_time": sum(seq_times),
@@ -831,35 +832,35 @@ async def _gpu_benchmark(
     if compare:
         console.print()
         console.print("[bold cyan]Running parallel LLM benchmark...[/bold cyan]")
-        pipeline_par = AnalysisPipeline(
+        async with AnalysisPipeline(
             adapter=adapter,
             github_token=os.environ.get("GITHUB_TOKEN"),
             skip_llm=False,
             llm_model=model,
-        )
-        pipeline_par.parallel_llm = True
-
-        par_times = []
-        par_llm_times = []
-        for pkg in packages:
-            console.print(f"  Analyzing {pkg}...")
-            start = time.perf_counter()
-
-            original_record = pipeline_par._record_timing
-            def track_llm_par(stage, duration):
-                if stage == "llm":
-                    par_llm_times.append(duration)
-                original_record(stage, duration)
-            pipeline_par._record_timing = track_llm_par
-
-            try:
-                await pipeline_par.analyze_package(pkg, save=False)
-            except Exception as e:
-                console.print(f"    [red]Error: {e}[/red]")
-                continue
-            total = time.perf_counter() - start
-            par_times.append(total)
-            console.print(f"    [green]Done in {total:.1f}s[/green]")
+        ) as pipeline_par:
+            pipeline_par.parallel_llm = True
+
+            par_times = []
+            par_llm_times = []
+            for pkg in packages:
+                console.print(f"  Analyzing {pkg}...")
+                start = time.perf_counter()
+
+                original_record = pipeline_par._record_timing
+                def track_llm_par(stage, duration):
+                    if stage == "llm":
+                        par_llm_times.append(duration)
+                    original_record(stage, duration)
+                pipeline_par._record_timing = track_llm_par
+
+                try:
+                    await pipeline_par.analyze_package(pkg, save=False)
+                except Exception as e:
+                    console.print(f"    [red]Error: {e}[/red]")
+                    continue
+                total = time.perf_counter() - start
+                par_times.append(total)
+                console.print(f"    [green]Done in {total:.1f}s[/green]")
 
         results["parallel"] = {
             "total_time": sum(par_times),
@@ -227,12 +227,15 @@ class ContinuousPipeline:
         try:
             await self._main_loop()
         finally:
+            # Close HTTP clients and caches first so a failed publish can't leak them
+            for pipeline in self._pipelines.values():
+                await pipeline.aclose()
+
             # Force publish any pending changes before exit
             if not self.no_publish:
                 logger.info("Publishing pending changes before shutdown...")
                 await self.publisher.force_publish()
 
-            # Clean up
             self.metrics._metrics.is_running = False
             self.metrics._metrics.current_package = ""
             self.metrics._save()